@@ -5,17 +5,31 @@ It is kept separate to improve code organization and maintainability.
 """
 
 import hashlib
-import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Generic, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
 RevisionId = tuple[int, int, str]  # (ordinal, timestamp_ns, content_hash)
 
+_T = TypeVar("_T")
+
+_REVISION_FILE_RE = re.compile(r"^(\d+)_(\d+)_([^_.]+)\.(yaml|meta\.json)$")
+"""Matches revision files: {ordinal}_{timestamp_ns}_{hash}.yaml and .meta.json sidecars."""
+
+_LEGACY_REVISION_FILE_RE = re.compile(r"^v(\d+)_(\d+(?:\.\d+)?)\.yaml$")
+"""Matches legacy revision files: v{ordinal}_{timestamp}.yaml."""
+
 if TYPE_CHECKING:
     pass
 
@@ -89,6 +103,8 @@ class ManifestRevisionMetadata(BaseModel):
     Revisions are identified by (ordinal, timestamp_ns, content_hash) triple.
     """
 
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     revision_id: RevisionId  # Full triple: (ordinal, timestamp_ns, content_hash)
     ordinal: int  # Sequential number (1, 2, 3...)
     timestamp_ns: int  # Nanosecond-precision timestamp
@@ -110,6 +126,8 @@ class ManifestRevision(BaseModel):
 class ManifestRevisionSummary(BaseModel):
     """Summary of a manifest revision (without full content)."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore", validate_assignment=False)
+
     revision_id: RevisionId  # Full triple
     ordinal: int  # For backwards compatibility
     timestamp_iso: str
@@ -129,63 +147,183 @@ class ManifestRevisionDiff(BaseModel):
     to_timestamp_iso: str
 
 
+class _PathCache(Generic[_T]):
+    """A bounded LRU cache of values loaded from files or directories, keyed by path.
+
+    An entry is reused only while the stat stamp it was loaded with still matches.
+    Writers must also call `invalidate()`, since a rewrite within the filesystem's
+    timestamp granularity can leave the stamp unchanged.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._maxsize = maxsize
+        self._entries: OrderedDict[str, tuple[tuple[int, ...], _T]] = OrderedDict()
+        self._invalidations = 0
+        self._lock = threading.Lock()
+
+    def get(self, path: str, stamp: tuple[int, ...], load: Callable[[str], _T]) -> _T:
+        """Return the cached value for `path`, calling `load(path)` on a miss.
+
+        Args:
+            path: File or directory path
+            stamp: Stat fields taken before loading, e.g. (mtime_ns, size)
+            load: Function that loads the value from `path`
+
+        Returns:
+            The cached or freshly loaded value
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(path)
+                return entry[1]
+            invalidations = self._invalidations
+
+        value = load(path)
+        with self._lock:
+            # A write since the stamp was taken may not show in it, so don't cache the value.
+            if self._invalidations == invalidations:
+                self._entries[path] = (stamp, value)
+                self._entries.move_to_end(path)
+                if len(self._entries) > self._maxsize:
+                    self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, path: str) -> None:
+        """Drop the cached value for `path` after writing to it."""
+        with self._lock:
+            self._invalidations += 1
+            self._entries.pop(path, None)
+
+
+@lru_cache(maxsize=256)
 def get_history_dir(manifest_path: Path) -> Path:
-    """Get the history directory for a manifest, ensuring it exists.
+    """Get the history directory for a manifest, creating it on first use.
+
+    This function is LRU cached to avoid repeated filesystem operations.
+    The directory is created on the first call for each manifest path only, so
+    it may have been removed since. Writers must call `ensure_history_dir()`.
 
     Args:
         manifest_path: Path to the manifest file
 
     Returns:
-        Path to the history directory (guaranteed to exist)
+        Path to the history directory
     """
     history_dir = manifest_path.parent / "history"
     history_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
     return history_dir
 
 
-def _compute_content_hash(content: str, length: int = 16) -> str:
+def ensure_history_dir(history_dir: Path) -> None:
+    """Recreate a history directory if it was removed after `get_history_dir()` cached it.
+
+    Args:
+        history_dir: History directory path
+    """
+    history_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+
+
+def _scan_revision_ids(history_dir: str) -> Mapping[int, RevisionId]:
+    """Scan a history directory for revisions.
+
+    If several files share an ordinal (which shouldn't happen), the one with the
+    latest timestamp wins.
+    """
+    revision_ids: dict[int, RevisionId] = {}
+    with os.scandir(history_dir) as entries:
+        for entry in entries:
+            match = _REVISION_FILE_RE.match(entry.name)
+            if not match or match[4] != "yaml":
+                continue
+            revision_id: RevisionId = (int(match[1]), int(match[2]), match[3])
+            current = revision_ids.get(revision_id[0])
+            if current is None or revision_id[1] > current[1]:
+                revision_ids[revision_id[0]] = revision_id
+    return MappingProxyType(revision_ids)
+
+
+_revision_ids_cache: _PathCache[Mapping[int, RevisionId]] = _PathCache(maxsize=256)
+"""Revision scans by history directory, keyed on the directory's modification time."""
+
+
+def _get_revision_ids_by_ordinal(history_dir: Path) -> Mapping[int, RevisionId]:
+    """Get the revisions in a history directory, keyed by ordinal.
+
+    Only revisions in the {ordinal}_{timestamp_ns}_{hash}.yaml format are included.
+    The scan is reused until the directory changes.
+
+    Args:
+        history_dir: History directory path
+
+    Returns:
+        Read-only mapping of ordinal to full RevisionId triple
+    """
+    try:
+        mtime_ns = history_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return MappingProxyType({})
+    return _revision_ids_cache.get(str(history_dir), (mtime_ns,), _scan_revision_ids)
+
+
+def _write_revision_content(revision_path: Path, content: bytes) -> None:
+    """Write a revision file and invalidate the cached scan of its directory.
+
+    The cached scan is dropped rather than relying on the directory's new modification
+    time alone, since two saves within the filesystem's timestamp granularity could
+    leave it unchanged. Scans of other history directories stay cached.
+
+    Args:
+        revision_path: Path to the revision YAML file
+        content: UTF-8 encoded manifest content
+    """
+    revision_path.write_bytes(content)
+    _revision_ids_cache.invalidate(str(revision_path.parent))
+
+
+def _compute_content_hash(content: str | bytes, length: int = 16) -> str:
     """Compute SHA256 hash of content.
 
     Args:
-        content: Content to hash
+        content: Content to hash, as text or as already UTF-8 encoded bytes
         length: Number of hex characters to return (default: 16)
 
     Returns:
         First `length` characters of SHA256 hex digest
     """
-    full_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    full_hash = hashlib.sha256(content).hexdigest()
     return full_hash[:length]
 
 
 def _get_next_ordinal(history_dir: Path) -> int:
     """Get the next ordinal number for a revision.
 
+    Uses the cached revision scan. The directory is only listed again for legacy
+    v{ordinal}_{timestamp}.yaml files when it has no revisions in the current format,
+    since current revisions are always numbered after any legacy ones.
+
     Args:
         history_dir: History directory path
 
     Returns:
         Next ordinal number (1-indexed)
     """
-    revision_files = list(history_dir.glob("*.yaml"))
-    if not revision_files:
+    revision_ids = _get_revision_ids_by_ordinal(history_dir)
+    if revision_ids:
+        return max(revision_ids) + 1
+
+    try:
+        with os.scandir(history_dir) as entries:
+            legacy_ordinals = [
+                int(match[1])
+                for entry in entries
+                if (match := _LEGACY_REVISION_FILE_RE.match(entry.name))
+            ]
+    except FileNotFoundError:
         return 1
-
-    max_ordinal = 0
-    for revision_file in revision_files:
-        try:
-            # Parse filename: {ordinal}_{timestamp_ns}_{hash}.yaml
-            parts = revision_file.stem.split("_")
-            if len(parts) >= 3:
-                ordinal = int(parts[0])
-                max_ordinal = max(max_ordinal, ordinal)
-            # Also support legacy format: v{ordinal}_{timestamp}.yaml
-            elif len(parts) >= 2 and parts[0].startswith("v"):
-                ordinal = int(parts[0][1:])
-                max_ordinal = max(max_ordinal, ordinal)
-        except (ValueError, IndexError):
-            continue
-
-    return max_ordinal + 1
+    return max(legacy_ordinals, default=0) + 1
 
 
 def _save_revision_metadata(
@@ -227,21 +365,80 @@ def _save_revision_metadata(
 
     # New filename format: {ordinal}_{timestamp_ns}_{hash}.meta.json
     metadata_path = history_dir / f"{ordinal}_{timestamp_ns}_{content_hash}.meta.json"
-    metadata_path.write_text(
-        json.dumps(metadata.model_dump(mode="json"), indent=2), encoding="utf-8"
-    )
+    _write_revision_metadata(metadata_path, metadata)
 
     return metadata_path
 
 
-def _load_revision_metadata(metadata_path: Path) -> "ManifestRevisionMetadata":
-    """Load revision metadata from a JSON file.
+def _write_revision_metadata(metadata_path: Path, metadata: ManifestRevisionMetadata) -> None:
+    """Write revision metadata to a JSON file and invalidate its cached copy.
+
+    The cached copy is dropped rather than relying on the new modification time
+    alone, since a rewrite within the filesystem's timestamp granularity could keep
+    the same (mtime, size) stamp. Cached metadata of other files is kept.
 
     Args:
         metadata_path: Path to metadata file
+        metadata: Revision metadata to write
+    """
+    metadata_path.write_text(metadata.model_dump_json(indent=2), encoding="utf-8")
+    _revision_metadata_cache.invalidate(str(metadata_path))
+
+
+def _parse_revision_metadata(metadata_path: str) -> ManifestRevisionMetadata:
+    """Parse a metadata file."""
+    with open(metadata_path, "rb") as f:
+        return ManifestRevisionMetadata.model_validate_json(f.read())
+
+
+_revision_metadata_cache: _PathCache[ManifestRevisionMetadata] = _PathCache(maxsize=1024)
+"""Parsed metadata by file path, keyed on the file's modification time and size."""
+
+
+def _load_revision_metadata(metadata_path: str | os.PathLike[str]) -> "ManifestRevisionMetadata":
+    """Load revision metadata from a JSON file.
+
+    Results are memoized, so the returned object may be shared between callers. Use
+    `model_copy(update=...)` to derive modified metadata instead of mutating it.
+
+    Args:
+        metadata_path: Path to metadata file, as a string or path-like object
 
     Returns:
         Revision metadata
     """
-    metadata_dict = json.loads(metadata_path.read_text(encoding="utf-8"))
-    return ManifestRevisionMetadata(**metadata_dict)
+    metadata_path = os.fspath(metadata_path)
+    stat_result = os.stat(metadata_path)
+    return _revision_metadata_cache.get(
+        metadata_path,
+        (stat_result.st_mtime_ns, stat_result.st_size),
+        _parse_revision_metadata,
+    )
+
+
+@lru_cache(maxsize=64)
+def _read_revision_content_cached(revision_path: str, mtime_ns: int, size: int) -> str:
+    """Read a revision file, memoized on its path, modification time and size."""
+    with open(revision_path, "rb") as f:
+        return f.read().decode("utf-8")
+
+
+def _read_revision_content(revision_path: str | os.PathLike[str]) -> str:
+    """Read the manifest content of a revision file.
+
+    Revision files are never rewritten once saved, so their content is memoized.
+
+    Args:
+        revision_path: Path to the revision YAML file, as a string or path-like object
+
+    Returns:
+        Manifest content
+
+    Raises:
+        FileNotFoundError: If the revision file does not exist
+    """
+    revision_path = os.fspath(revision_path)
+    stat_result = os.stat(revision_path)
+    return _read_revision_content_cached(
+        revision_path, stat_result.st_mtime_ns, stat_result.st_size
+    )
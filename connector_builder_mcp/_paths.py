@@ -8,7 +8,7 @@ import hashlib
 from functools import lru_cache
 from pathlib import Path
 
-from connector_builder_mcp.constants import SESSION_BASE_DIR
+from connector_builder_mcp.constants import get_session_base_dir
 
 
 def _sanitize_session_id(session_id: str) -> str:
@@ -27,7 +27,7 @@ def _sanitize_session_id(session_id: str) -> str:
 def get_session_dir(session_id: str) -> Path:
     """Get the directory path for a session, ensuring it exists.
 
-    DEPRECATED: This function uses the legacy SESSION_BASE_DIR constant.
+    DEPRECATED: This function uses the legacy session base directory.
     New code should use resolve_session_manifest_path() which respects
     environment variable overrides.
 
@@ -41,7 +41,7 @@ def get_session_dir(session_id: str) -> Path:
         Path to the session directory (guaranteed to exist)
     """
     sanitized_id = _sanitize_session_id(session_id)
-    session_dir = SESSION_BASE_DIR / sanitized_id
+    session_dir = get_session_base_dir() / sanitized_id
     session_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
     return session_dir
 
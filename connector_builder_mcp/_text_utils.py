@@ -3,6 +3,9 @@
 import difflib
 
 
+NO_CHANGES_DIFF = "[no changes]"
+
+
 def replace_all_text(
     *,
     old_content: str,
@@ -174,7 +177,7 @@ def unified_diff_with_context(old_text: str, new_text: str, context: int = 2) ->
         context: Number of context lines to show around changes (default: 2)
 
     Returns:
-        Unified diff string, or "[no changes]" if texts are identical
+        Unified diff string, or NO_CHANGES_DIFF if texts are identical
     """
     old_lines = old_text.splitlines(keepends=True)
     new_lines = new_text.splitlines(keepends=True)
@@ -189,4 +192,4 @@ def unified_diff_with_context(old_text: str, new_text: str, context: int = 2) ->
     )
 
     diff = "\n".join(diff_lines)
-    return diff or "[no changes]"
+    return diff or NO_CHANGES_DIFF
@@ -8,11 +8,6 @@ from typing import Any, cast, overload
 
 import yaml
 
-from airbyte_cdk.sources.declarative.models import DeclarativeSource
-from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import (
-    ManifestReferenceResolver,
-)
-
 
 def initialize_logging() -> None:
     """Initialize logging configuration for the MCP server."""
@@ -173,6 +168,13 @@ def is_valid_declarative_source_manifest(manifest: dict[str, Any]) -> tuple[bool
     Returns:
         True if the manifest can be parsed as DeclarativeSource, False otherwise.
     """
+    # Imported here rather than at module scope, since importing the CDK takes
+    # seconds and this module is loaded at server startup.
+    from airbyte_cdk.sources.declarative.models import DeclarativeSource
+    from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import (
+        ManifestReferenceResolver,
+    )
+
     try:
         reference_resolver = ManifestReferenceResolver()
         resolved_manifest = reference_resolver.preprocess_manifest(manifest)
@@ -11,18 +11,6 @@ from typing import Any, cast
 import yaml
 from jsonschema import Draft7Validator, ValidationError, validate
 
-from airbyte_cdk.connector_builder.connector_builder_handler import (
-    create_source,
-    get_limits,
-    resolve_manifest,
-)
-from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import (
-    ManifestComponentTransformer,
-)
-from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import (
-    ManifestReferenceResolver,
-)
-
 from connector_builder_mcp._util import (
     is_valid_declarative_source_manifest,
     parse_manifest_input,
@@ -163,6 +151,20 @@ def validate_manifest_content(
         - warnings: list[str] - List of validation warnings
         - resolved_manifest: dict[str, Any] | None - Resolved manifest dict if successful
     """
+    # The CDK is imported here rather than at module scope, since importing it takes
+    # seconds and global tools such as manifest edits load this module at startup.
+    from airbyte_cdk.connector_builder.connector_builder_handler import (
+        create_source,
+        get_limits,
+        resolve_manifest,
+    )
+    from airbyte_cdk.sources.declarative.parsers.manifest_component_transformer import (
+        ManifestComponentTransformer,
+    )
+    from airbyte_cdk.sources.declarative.parsers.manifest_reference_resolver import (
+        ManifestReferenceResolver,
+    )
+
     errors: list[str] = []
     warnings: list[str] = []
     resolved_manifest: dict[str, Any] | None = None
@@ -6,15 +6,61 @@ utility for different connector build strategies.
 
 from __future__ import annotations
 
+import copy
+import functools
+import importlib
+import importlib.resources
+import json
+import logging
 import sys
+import threading
 from abc import ABC, abstractmethod
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
-import yaml
 from fastmcp import FastMCP
 
 
+if TYPE_CHECKING:
+    from importlib.abc import Traversable
+
+
+logger = logging.getLogger(__name__)
+
+
+@functools.cache
+def _get_yaml_safe_loader() -> type:
+    """Get the fastest available safe YAML loader class.
+
+    PyYAML is imported here rather than at module scope, since checklists are
+    usually served from the in-memory or JSON caches without touching YAML.
+    """
+    try:
+        from yaml import CSafeLoader
+
+        return CSafeLoader
+    except ImportError:  # pragma: no cover - depends on how PyYAML was built
+        from yaml import SafeLoader
+
+        logger.warning(
+            "LibYAML bindings are unavailable; falling back to the pure-Python YAML loader."
+        )
+        return SafeLoader
+
+
+@functools.cache
+def _get_strategy_files(module_name: str) -> Traversable:
+    """Resolve the package directory of a strategy module.
+
+    The package is taken from `sys.modules` when already imported, otherwise it is
+    imported. Cached so resolution happens once per strategy module.
+    """
+    package_name = module_name.rpartition(".")[0]
+    package = sys.modules.get(package_name) or importlib.import_module(package_name)
+    return importlib.resources.files(package)
+
+
 class BuildStrategy(ABC):
     """Stateless registration utility for connector build strategies.
 
@@ -47,6 +93,25 @@ class BuildStrategy(ABC):
     is_default: ClassVar[bool] = False
     """Whether this is the default strategy when none is specified."""
 
+    _registration_steps: ClassVar[tuple[Callable[[FastMCP], None], ...]] = ()
+    """Bound registration classmethods, in order, captured when the subclass is created."""
+
+    _checklist_cache: ClassVar[dict[tuple[type, str, int], dict[str, Any]]] = {}
+    """Parsed checklist YAML, keyed by (strategy class, file path, file mtime in ns)."""
+
+    _checklist_cache_lock: ClassVar[threading.Lock] = threading.Lock()
+    """Guards access to `_checklist_cache`."""
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Capture the subclass's registration steps for `register_all_mcp_callables`."""
+        super().__init_subclass__(**kwargs)
+        cls._registration_steps = (
+            cls.register_guidance_tools,
+            cls.register_validation_tools,
+            cls.register_testing_tools,
+            cls.register_prompts,
+        )
+
     @classmethod
     @abstractmethod
     def is_available(cls) -> bool:
@@ -65,8 +130,9 @@ class BuildStrategy(ABC):
     def register_guidance_tools(cls, app: FastMCP) -> None:
         """Register guidance domain tools by calling registration functions.
 
-        This method should import the relevant mcp module at the top of the
-        strategy file and call its registration function here.
+        This method should import the relevant mcp module inside the method body
+        and call its registration function here, so that the module is only loaded
+        when the strategy is registered.
 
         Args:
             app: FastMCP application instance
@@ -108,16 +174,14 @@ class BuildStrategy(ABC):
         """Register all MCP callables (tools, prompts, resources) for this strategy.
 
         This is a convenience method that calls all the abstract registration
-        methods in a fixed order. Strategies can override this if they need
-        custom registration logic.
+        methods in a fixed order (see `_registration_steps`). Strategies can
+        override this if they need custom registration logic.
 
         Args:
             app: FastMCP application instance
         """
-        cls.register_guidance_tools(app)
-        cls.register_validation_tools(app)
-        cls.register_testing_tools(app)
-        cls.register_prompts(app)
+        for step in cls._registration_steps:
+            step(app)
 
     @classmethod
     def get_checklist_path(cls) -> str:
@@ -131,12 +195,78 @@ class BuildStrategy(ABC):
         """
         return "checklist.yaml"
 
+    @classmethod
+    def get_checklist_json_path(cls) -> str:
+        """Get the filename of this strategy's precompiled checklist JSON cache.
+
+        Default implementation swaps the suffix of `get_checklist_path()` for ".json".
+
+        Returns:
+            Filename of the checklist JSON sidecar (default: "checklist.json")
+        """
+        return str(Path(cls.get_checklist_path()).with_suffix(".json"))
+
+    @classmethod
+    def _get_strategy_resource(cls, filename: str) -> Traversable:
+        """Resolve a file in this strategy's package directory.
+
+        Uses `importlib.resources` so resources also resolve from zip or frozen installs.
+        """
+        return _get_strategy_files(cls.__module__).joinpath(filename)
+
+    @classmethod
+    def _parse_checklist_yaml(cls, resource: Traversable) -> dict[str, Any]:
+        """Parse and validate a checklist YAML resource.
+
+        Raises:
+            TypeError: If YAML root is not a dict with string keys
+        """
+        import yaml
+
+        data = yaml.load(resource.read_bytes(), Loader=_get_yaml_safe_loader())
+        if not isinstance(data, dict):
+            raise TypeError(f"Expected mapping at YAML root, got {type(data).__name__}")
+        if not all(isinstance(k, str) for k in data.keys()):
+            raise TypeError("Checklist YAML must have string keys at the root")
+        return cast(dict[str, Any], data)
+
+    @classmethod
+    def write_checklist_json_cache(cls) -> Path:
+        """Parse this strategy's checklist YAML and write it to the JSON sidecar.
+
+        Used by the `precompile_checklists` entry point in development checkouts.
+        Wheels get their sidecars from the hatch build hook in `hatch_build.py`.
+
+        Returns:
+            Path to the written JSON file
+
+        Raises:
+            OSError: If the strategy is not installed on the filesystem, or the
+                JSON file cannot be written
+            TypeError: If the checklist contains values JSON cannot represent
+        """
+        resource = cls._get_strategy_resource(cls.get_checklist_path())
+        if not isinstance(resource, Path):
+            raise OSError(f"Checklist for strategy '{cls.name}' is not on the filesystem")
+
+        data = cls._parse_checklist_yaml(resource)
+        json_path = resource.parent / cls.get_checklist_json_path()
+        json_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        return json_path
+
     @classmethod
     def load_checklist_yaml(cls) -> dict[str, Any]:
         """Load checklist YAML for this build strategy.
 
         Calls cls.get_checklist_path() to get the strategy-specific filename,
-        then loads and validates the YAML file from the strategy's directory.
+        then loads and validates the YAML file from the strategy's package.
+
+        Parsed results are cached in memory and reused until the file's mtime
+        changes. Each call returns a deep copy so callers may mutate the result.
+
+        If a JSON sidecar (see `get_checklist_json_path()`) is at least as new as
+        the YAML file, it is parsed instead of the YAML. Sidecars are only written
+        at build time (see `write_checklist_json_cache()`), never by this method.
 
         Returns:
             Parsed checklist YAML as dictionary
@@ -144,30 +274,39 @@ class BuildStrategy(ABC):
         Raises:
             FileNotFoundError: If checklist file doesn't exist
             TypeError: If YAML root is not a dict with string keys
-            RuntimeError: If strategy module is not loaded
         """
-        checklist_filename = cls.get_checklist_path()
-
-        module = sys.modules.get(cls.__module__)
-        if module is None:
-            raise RuntimeError(f"Strategy module '{cls.__module__}' is not loaded")
-        if not hasattr(module, "__file__") or module.__file__ is None:
-            raise RuntimeError(f"Strategy module '{cls.__module__}' has no __file__ attribute")
-
-        strategy_dir = Path(module.__file__).parent
-        full_path = strategy_dir / checklist_filename
-
-        if not full_path.exists():
+        resource = cls._get_strategy_resource(cls.get_checklist_path())
+        if not resource.is_file():
             raise FileNotFoundError(
-                f"Checklist file not found for strategy '{cls.name}': {full_path}"
+                f"Checklist file not found for strategy '{cls.name}': {resource}"
             )
 
-        data = yaml.safe_load(full_path.read_text(encoding="utf-8"))
+        # Resources inside zip or frozen installs are immutable, so they never go stale.
+        yaml_mtime_ns = resource.stat().st_mtime_ns if isinstance(resource, Path) else 0
+
+        cache_key = (cls, str(resource), yaml_mtime_ns)
+        with cls._checklist_cache_lock:
+            cached = cls._checklist_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        json_path = (
+            resource.parent / cls.get_checklist_json_path() if isinstance(resource, Path) else None
+        )
+        data: dict[str, Any] | None = None
+        if json_path is not None:
+            try:
+                if json_path.stat().st_mtime_ns >= yaml_mtime_ns:
+                    data = json.loads(json_path.read_bytes())
+            except (OSError, ValueError):
+                data = None
+
         if not isinstance(data, dict):
-            raise TypeError(f"Expected mapping at YAML root, got {type(data).__name__}")
-        if not all(isinstance(k, str) for k in data.keys()):
-            raise TypeError("Checklist YAML must have string keys at the root")
-        return cast(dict[str, Any], data)
+            data = cls._parse_checklist_yaml(resource)
+
+        with cls._checklist_cache_lock:
+            cls._checklist_cache[cache_key] = data
+        return copy.deepcopy(data)
 
     @classmethod
     def get_scaffold_template(cls, auth_type: str) -> str:
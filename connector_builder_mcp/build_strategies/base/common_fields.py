@@ -0,0 +1,28 @@
+"""Shared Pydantic field descriptors for build strategy tool parameters.
+
+Tool parameters that appear with the same description in several strategies
+reuse these `FieldInfo` instances via `Annotated[..., FIELD]`, so each one is
+constructed once at import time.
+"""
+
+from pydantic import Field
+
+
+CONFIG_FIELD = Field(description="Connector configuration dictionary (including auth credentials).")
+"""Connector configuration, including auth credentials."""
+
+STREAM_NAME_FIELD = Field(description="Name of the stream to test")
+"""Name of the stream a testing tool operates on."""
+
+MAX_RECORDS_FIELD = Field(description="Maximum number of records to read", ge=1)
+"""Maximum number of records a testing tool reads."""
+
+KOTLIN_SOURCE_PROJECT_PATH_FIELD = Field(
+    description="Path to the Kotlin source connector project directory"
+)
+"""Path to a Kotlin source connector project."""
+
+KOTLIN_DESTINATION_PROJECT_PATH_FIELD = Field(
+    description="Path to the Kotlin destination connector project directory"
+)
+"""Path to a Kotlin destination connector project."""
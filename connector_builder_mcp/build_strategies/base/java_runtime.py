@@ -0,0 +1,52 @@
+"""Java runtime detection shared by the Kotlin build strategies."""
+
+from __future__ import annotations
+
+import functools
+import os
+import re
+
+from connector_builder_mcp.constants import CONNECTOR_BUILDER_SKIP_JAVA_PROBE
+
+
+_JAVA_VERSION_ENV_RE = re.compile(r"^(?:jdk-?)?21(?:[.+_-]|$)")
+"""Matches a `JAVA_VERSION` env value for Java 21 (e.g. "21", "21.0.2", "jdk-21.0.2+13")."""
+
+_JAVA_21_VERSION_OUTPUT_RE = re.compile(rb'version "21[."]', re.IGNORECASE)
+"""Matches the version line of `java -version` output for Java 21 (e.g. `openjdk version "21.0.2"`)."""
+
+
+@functools.cache
+def is_java_21_available() -> bool:
+    """Check if Java 21 is installed and available.
+
+    The result is cached for the lifetime of the process. The `java -version` probe
+    is skipped when the `JAVA_VERSION` environment variable already reports Java 21,
+    or when `CONNECTOR_BUILDER_SKIP_JAVA_PROBE` is set.
+
+    Returns:
+        True if Java 21 is available, False otherwise.
+    """
+    if _JAVA_VERSION_ENV_RE.match(os.environ.get("JAVA_VERSION", "")):
+        return True
+
+    if os.environ.get(CONNECTOR_BUILDER_SKIP_JAVA_PROBE, "").lower() in {"1", "true"}:
+        return False
+
+    import shutil
+    import subprocess
+
+    java_path = shutil.which("java")
+    if not java_path:
+        return False
+
+    try:
+        result = subprocess.run(
+            ["java", "-version"],
+            capture_output=True,
+            timeout=5,
+        )
+        version_output = result.stderr + result.stdout
+        return _JAVA_21_VERSION_OUTPUT_RE.search(version_output) is not None
+    except (subprocess.TimeoutExpired, subprocess.SubprocessError):
+        return False
@@ -9,12 +9,6 @@ from __future__ import annotations
 from fastmcp import FastMCP
 
 from connector_builder_mcp.build_strategies.base.build_strategy import BuildStrategy
-from connector_builder_mcp.build_strategies.declarative_openapi_v3 import (
-    guidance,
-    manifest_checks,
-    manifest_tests,
-    prompts,
-)
 
 
 class DeclarativeOpenApiV3Strategy(BuildStrategy):
@@ -39,19 +33,27 @@ class DeclarativeOpenApiV3Strategy(BuildStrategy):
     @classmethod
     def register_guidance_tools(cls, app: FastMCP) -> None:
         """Register guidance tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.declarative_openapi_v3 import guidance
+
         guidance.register_guidance_tools(app)
 
     @classmethod
     def register_validation_tools(cls, app: FastMCP) -> None:
         """Register validation tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.declarative_openapi_v3 import manifest_checks
+
         manifest_checks.register_validation_tools(app)
 
     @classmethod
     def register_testing_tools(cls, app: FastMCP) -> None:
         """Register testing tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.declarative_openapi_v3 import manifest_tests
+
         manifest_tests.register_testing_tools(app)
 
     @classmethod
     def register_prompts(cls, app: FastMCP) -> None:
         """Register prompts by calling the registration function."""
+        from connector_builder_mcp.build_strategies.declarative_openapi_v3 import prompts
+
         prompts.register_prompts(app)
@@ -5,7 +5,9 @@ building OpenAPI-based connectors with Sonar's connector-sdk.
 """
 
 import logging
-from typing import Annotated
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Annotated, Literal
 
 from fastmcp import FastMCP
 from pydantic import Field
@@ -16,29 +18,16 @@ from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_
 logger = logging.getLogger(__name__)
 
 
-@mcp_tool(
-    domain=ToolDomain.GUIDANCE,
-)
-def get_openapi_connector_docs(
-    topic: Annotated[
-        str | None,
-        Field(
-            description="Specific topic to get detailed documentation for. If not provided, returns high-level overview."
-        ),
-    ] = None,
-) -> str:
-    """Get OpenAPI/Sonar connector builder documentation and guidance.
+OpenApiDocsTopic = Literal[
+    "openapi_overview",
+    "x_airbyte_extensions",
+    "authentication",
+    "pagination",
+    "schema_mapping",
+]
+"""Topics accepted by `get_openapi_connector_docs`."""
 
-    Args:
-        topic: Optional specific topic for detailed documentation
-
-    Returns:
-        High-level overview or detailed topic-specific documentation
-    """
-    logger.info(f"Getting OpenAPI connector docs for topic: {topic}")
-
-    if not topic:
-        return """# OpenAPI/Sonar Connector Builder Documentation
+_OVERVIEW_DOC = """# OpenAPI/Sonar Connector Builder Documentation
 
 **Important**: Before starting development, call the `get_connector_builder_checklist()` tool.
 The checklist provides step-by-step guidance for building OpenAPI-based connectors.
@@ -70,8 +59,10 @@ For detailed guidance on specific aspects, request documentation for:
 - **pagination**: Pagination strategies and configuration
 - **schema_mapping**: Mapping OpenAPI schemas to Airbyte schemas
 """
+"""High-level overview returned when no topic is requested."""
 
-    topic_docs = {
+_TOPIC_DOCS: Mapping[OpenApiDocsTopic, str] = MappingProxyType(
+    {
         "openapi_overview": """# OpenAPI Connector Development Overview
 
 OpenAPI-based connectors use extended OpenAPI 3.0 specifications to define
@@ -191,15 +182,45 @@ Required fields from OpenAPI are marked as required in Airbyte schemas.
 Nullable fields are handled using oneOf with null type.
 """,
     }
+)
+"""Detailed documentation keyed by topic name."""
+
+_AVAILABLE_TOPICS = ", ".join(_TOPIC_DOCS)
+
+
+@mcp_tool(
+    domain=ToolDomain.GUIDANCE,
+)
+def get_openapi_connector_docs(
+    topic: Annotated[
+        OpenApiDocsTopic | None,
+        Field(
+            description="Specific topic to get detailed documentation for. If not provided, returns high-level overview."
+        ),
+    ] = None,
+) -> str:
+    """Get OpenAPI/Sonar connector builder documentation and guidance.
+
+    Args:
+        topic: Optional specific topic for detailed documentation
+
+    Returns:
+        High-level overview or detailed topic-specific documentation
+    """
+    logger.info("Getting OpenAPI connector docs for topic: %s", topic)
+
+    if not topic:
+        return _OVERVIEW_DOC
 
-    if topic in topic_docs:
-        return topic_docs[topic]
+    doc = _TOPIC_DOCS.get(topic)
+    if doc is not None:
+        return doc
 
-    return f"# {topic} Documentation\n\nTopic '{topic}' not found. Available topics: {', '.join(topic_docs.keys())}"
+    return f"# {topic} Documentation\n\nTopic '{topic}' not found. Available topics: {_AVAILABLE_TOPICS}"
 
 
 def register_guidance_tools(
     app: FastMCP,
 ):
     """Register guidance tools in the MCP server."""
-    register_mcp_tools(app, domain=ToolDomain.GUIDANCE)
+    register_mcp_tools(app, domain=ToolDomain.GUIDANCE, package=__package__)
@@ -5,24 +5,98 @@ configurations without actually running the connector.
 """
 
 import logging
+import re
+from pathlib import Path
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_mcp_tools
 
 
 logger = logging.getLogger(__name__)
 
+_SPEC_SNIFF_RE = re.compile(r"(?i:openapi|paths)|x-airbyte")
+"""Matches the markers checked by `validate_openapi_spec` ('x-airbyte' is case-sensitive)."""
+
+_SPEC_SNIFF_TOKENS = frozenset({"openapi", "paths", "x-airbyte"})
+
+
+def _sniff_spec_tokens(spec_content: str) -> set[str]:
+    """Find which of the `_SPEC_SNIFF_TOKENS` appear in the spec, in a single pass.
+
+    Stops scanning as soon as every token has been seen.
+    """
+    seen: set[str] = set()
+    for match in _SPEC_SNIFF_RE.finditer(spec_content):
+        seen.add(match.group(0).lower())
+        if len(seen) == len(_SPEC_SNIFF_TOKENS):
+            break
+    return seen
+
+
+_SPEC_READ_CHUNK_SIZE = 64 * 1024
+"""Number of characters read per chunk when scanning a spec file."""
+
+_SPEC_CHUNK_OVERLAP = max(len(token) for token in _SPEC_SNIFF_TOKENS) - 1
+"""Characters carried over between chunks so markers spanning a chunk boundary are found."""
+
+_MAX_SPEC_PATH_LENGTH = 4096
+"""Inputs longer than this are never treated as a file path."""
+
+
+def _resolve_spec_path(spec_content: str) -> Path | None:
+    """Return the spec file path if `spec_content` is a path to an existing file.
+
+    Like `parse_manifest_input`, only single-line input is treated as a path.
+    """
+    if len(spec_content) > _MAX_SPEC_PATH_LENGTH or "\n" in spec_content:
+        return None
+
+    path = Path(spec_content)
+    try:
+        return path if path.is_file() else None
+    except OSError:
+        return None
+
+
+def _sniff_spec_file_tokens(spec_path: Path) -> tuple[set[str], int]:
+    """Find which of the `_SPEC_SNIFF_TOKENS` appear in a spec file.
+
+    The file is read in chunks, and reading stops as soon as every token has been seen.
+
+    Returns:
+        The tokens found, and the number of characters read. This is the spec's full
+        length in characters unless reading stopped early, in which case it is at least
+        the combined length of the tokens.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    seen: set[str] = set()
+    tail = ""
+    chars_read = 0
+    with spec_path.open(encoding="utf-8", errors="replace") as spec_file:
+        while chunk := spec_file.read(_SPEC_READ_CHUNK_SIZE):
+            chars_read += len(chunk)
+            window = tail + chunk
+            seen |= _sniff_spec_tokens(window)
+            if len(seen) == len(_SPEC_SNIFF_TOKENS):
+                break
+            tail = window[-_SPEC_CHUNK_OVERLAP:]
+    return seen, chars_read
+
 
 class OpenApiValidationResult(BaseModel):
     """Result of OpenAPI specification validation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     is_valid: bool
-    errors: list[str] = []
-    warnings: list[str] = []
-    resources_found: list[str] = []
+    errors: tuple[str, ...] = ()
+    warnings: tuple[str, ...] = ()
+    resources_found: tuple[str, ...] = ()
 
 
 @mcp_tool(
@@ -54,37 +128,51 @@ def validate_openapi_spec(
     logger.info("Validating OpenAPI specification")
 
     if spec_content is None:
-        return OpenApiValidationResult(
+        return OpenApiValidationResult.model_construct(
             is_valid=False,
-            errors=["No OpenAPI specification provided"],
-            warnings=[],
+            errors=("No OpenAPI specification provided",),
+            warnings=(),
         )
 
     errors: list[str] = []
     warnings: list[str] = []
     resources_found: list[str] = []
 
-    if len(spec_content) < 10:
+    spec_path = _resolve_spec_path(spec_content)
+    if spec_path is not None:
+        try:
+            seen_tokens, spec_length = _sniff_spec_file_tokens(spec_path)
+        except OSError as e:
+            return OpenApiValidationResult.model_construct(
+                is_valid=False,
+                errors=(f"Could not read OpenAPI specification file: {e}",),
+                warnings=(),
+            )
+    else:
+        spec_length = len(spec_content)
+        seen_tokens = _sniff_spec_tokens(spec_content)
+
+    if spec_length < 10:
         errors.append("OpenAPI specification appears to be empty or too short")
 
-    if "openapi" not in spec_content.lower():
+    if "openapi" not in seen_tokens:
         errors.append("Missing 'openapi' version field")
 
-    if "paths" not in spec_content.lower():
+    if "paths" not in seen_tokens:
         warnings.append("No 'paths' section found in specification")
 
-    if "x-airbyte" not in spec_content:
+    if "x-airbyte" not in seen_tokens:
         warnings.append(
             "No x-airbyte-* extensions found. You may need to add these to define resources."
         )
 
     is_valid = len(errors) == 0
 
-    return OpenApiValidationResult(
+    return OpenApiValidationResult.model_construct(
         is_valid=is_valid,
-        errors=errors,
-        warnings=warnings,
-        resources_found=resources_found,
+        errors=tuple(errors),
+        warnings=tuple(warnings),
+        resources_found=tuple(resources_found),
     )
 
 
@@ -94,4 +182,4 @@ def register_validation_tools(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_tools(app, domain=ToolDomain.VALIDATION)
+    register_mcp_tools(app, domain=ToolDomain.VALIDATION, package=__package__)
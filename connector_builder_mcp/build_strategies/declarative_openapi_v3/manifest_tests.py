@@ -8,8 +8,9 @@ import logging
 from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from connector_builder_mcp.build_strategies.base import common_fields
 from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_mcp_tools
 
 
@@ -19,15 +20,30 @@ logger = logging.getLogger(__name__)
 class ResourceTestResult(BaseModel):
     """Result of resource testing operation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     success: bool
     message: str
     records_read: int = 0
-    errors: list[str] = []
+    errors: tuple[str, ...] = ()
     records: list[dict[str, Any]] | None = Field(
         default=None, description="Actual record data from the resource"
     )
 
 
+# Prebuilt results for the constant error paths of `test_openapi_resource`.
+_NO_SPEC_ERROR = ResourceTestResult.model_construct(
+    success=False,
+    message="No OpenAPI specification provided",
+    errors=("No OpenAPI specification provided",),
+)
+_NO_CONFIG_ERROR = ResourceTestResult.model_construct(
+    success=False,
+    message="No configuration provided",
+    errors=("Configuration with credentials is required for testing",),
+)
+
+
 @mcp_tool(
     domain=ToolDomain.TESTING,
     open_world=True,
@@ -47,11 +63,11 @@ def test_openapi_resource(
     ] = None,
     config: Annotated[
         dict[str, Any] | str | None,
-        Field(description="Connector configuration dictionary (including auth credentials)."),
+        common_fields.CONFIG_FIELD,
     ] = None,
     max_records: Annotated[
         int,
-        Field(description="Maximum number of records to read", ge=1),
+        common_fields.MAX_RECORDS_FIELD,
     ] = 10,
 ) -> ResourceTestResult:
     """Test reading data from an OpenAPI resource.
@@ -66,27 +82,19 @@ def test_openapi_resource(
     Returns:
         Test result with success status and any errors
     """
-    logger.info(f"Testing OpenAPI resource: {resource_name}")
+    logger.info("Testing OpenAPI resource: %s", resource_name)
 
     if spec_content is None:
-        return ResourceTestResult(
-            success=False,
-            message="No OpenAPI specification provided",
-            errors=["No OpenAPI specification provided"],
-        )
+        return _NO_SPEC_ERROR
 
     if config is None:
-        return ResourceTestResult(
-            success=False,
-            message="No configuration provided",
-            errors=["Configuration with credentials is required for testing"],
-        )
+        return _NO_CONFIG_ERROR
 
-    return ResourceTestResult(
+    return ResourceTestResult.model_construct(
         success=True,
         message=f"Successfully tested resource '{resource_name}' (placeholder implementation)",
         records_read=0,
-        errors=[],
+        errors=(),
         records=[],
     )
 
@@ -97,4 +105,4 @@ def register_testing_tools(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_tools(app, domain=ToolDomain.TESTING)
+    register_mcp_tools(app, domain=ToolDomain.TESTING, package=__package__)
@@ -6,17 +6,14 @@ connectors are defined entirely in YAML manifests without custom Python code.
 
 from __future__ import annotations
 
-import sys
-
-from fastmcp import FastMCP
+import importlib.util
+from typing import TYPE_CHECKING
 
 from connector_builder_mcp.build_strategies.base.build_strategy import BuildStrategy
-from connector_builder_mcp.build_strategies.declarative_yaml_v1 import (
-    guidance,
-    manifest_checks,
-    manifest_tests,
-    prompts,
-)
+
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 
 class DeclarativeYamlV1Strategy(BuildStrategy):
@@ -35,27 +32,35 @@ class DeclarativeYamlV1Strategy(BuildStrategy):
     def is_available(cls) -> bool:
         """Check if airbyte-cdk is available.
 
-        Returns True if airbyte-cdk is in sys.modules.
-        Not referenced anywhere yet, but part of class signature.
+        Returns True if airbyte-cdk is installed. The package is located without
+        importing it, since the CDK is only imported when a tool first needs it.
         """
-        return "airbyte_cdk" in sys.modules
+        return importlib.util.find_spec("airbyte_cdk") is not None
 
     @classmethod
     def register_guidance_tools(cls, app: FastMCP) -> None:
         """Register guidance tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.declarative_yaml_v1 import guidance
+
         guidance.register_guidance_tools(app)
 
     @classmethod
     def register_validation_tools(cls, app: FastMCP) -> None:
         """Register validation tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.declarative_yaml_v1 import manifest_checks
+
         manifest_checks.register_validation_tools(app)
 
     @classmethod
     def register_testing_tools(cls, app: FastMCP) -> None:
         """Register testing tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.declarative_yaml_v1 import manifest_tests
+
         manifest_tests.register_testing_tools(app)
 
     @classmethod
     def register_prompts(cls, app: FastMCP) -> None:
         """Register prompts by calling the registration function."""
+        from connector_builder_mcp.build_strategies.declarative_yaml_v1 import prompts
+
         prompts.register_prompts(app)
@@ -5,15 +5,27 @@ building connectors with the Connector Builder MCP server.
 """
 
 import csv
+import itertools
+import json
 import logging
+import os
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Any
 
 import requests
 from fastmcp import FastMCP
 from pydantic import Field
+from requests.adapters import HTTPAdapter, Retry
 
 from connector_builder_mcp._guidance.topics import TOPIC_MAPPING
+from connector_builder_mcp.constants import get_session_base_dir
 from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_mcp_tools
 
 
@@ -23,6 +35,63 @@ _REGISTRY_URL = "https://connectors.airbyte.com/files/registries/v0/oss_registry
 _MANIFEST_ONLY_LANGUAGE = "manifest-only"
 _MANIFEST_SCHEMA_URL = "https://raw.githubusercontent.com/airbytehq/airbyte-python-cdk/refs/heads/main/airbyte_cdk/sources/declarative/declarative_component_schema.yaml"
 _HTTP_OK = 200
+_HTTP_NOT_MODIFIED = 304
+_REGISTRY_TTL_SECONDS = 600
+_REGISTRY_FAILURE_BACKOFF_SECONDS = 30
+_REGISTRY_REFRESH_WAIT_SECONDS = 10
+_REGISTRY_CACHE_FILENAME = "registry_cache.json"
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+_TCP_KEEPALIVE_IDLE_SECONDS = 60
+
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),  # Same as the connection pool default
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+if hasattr(socket, "TCP_KEEPIDLE"):  # Not available on macOS or Windows
+    _SOCKET_OPTIONS.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, _TCP_KEEPALIVE_IDLE_SECONDS))
+
+
+class _KeepAliveHTTPAdapter(HTTPAdapter):
+    """HTTP adapter that enables TCP keepalive, so pooled connections survive idle periods."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _create_http_session() -> requests.Session:
+    """Create an HTTP session that pools keep-alive connections and retries transient errors."""
+    session = requests.Session()
+    adapter = _KeepAliveHTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=_RETRY_STATUS_CODES),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_HTTP_SESSION = _create_http_session()
+"""Shared HTTP session, so repeated registry and manifest requests reuse open connections."""
+
+
+@dataclass
+class _RegistrySnapshot:
+    """Manifest-only flags fetched from connectors.airbyte.com, with cache validators."""
+
+    index: dict[str, bool]
+    fetched_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+_registry_snapshot: _RegistrySnapshot | None = None
+_registry_failed_at: float | None = None
+_registry_refresh: Future[dict[str, bool]] | None = None
+"""The registry download in flight, if any, so concurrent lookups share one request."""
+_registry_lock = threading.Lock()
+"""Guards the registry state above. Never held across network requests."""
 
 
 @mcp_tool(
@@ -44,7 +113,7 @@ def get_connector_builder_docs(
     Returns:
         High-level overview with topic list, or detailed topic-specific documentation
     """
-    logger.info(f"Getting connector builder docs for topic: {topic}")
+    logger.info("Getting connector builder docs for topic: %s", topic)
 
     if not topic:
         return """# Connector Builder Documentation
@@ -61,7 +130,7 @@ For detailed guidance on specific components and features, you can request docum
 
 def _get_topic_specific_docs(topic: str) -> str:
     """Get detailed documentation for a specific topic using raw GitHub URLs."""
-    logger.info(f"Fetching detailed docs for topic: {topic}")
+    logger.info("Fetching detailed docs for topic: %s", topic)
 
     if topic not in TOPIC_MAPPING:
         return f"# {topic} Documentation\n\nTopic '{topic}' not found. Please check the available topics list from the overview.\n\nAvailable topics: {', '.join(TOPIC_MAPPING.keys())}"
@@ -74,14 +143,14 @@ def _get_topic_specific_docs(topic: str) -> str:
         full_url = f"https://raw.githubusercontent.com/airbytehq/airbyte/master/{topic_path}"
 
     try:
-        response = requests.get(full_url, timeout=30)
+        response = _HTTP_SESSION.get(full_url, timeout=30)
         response.raise_for_status()
 
         markdown_content = response.text
         return f"# '{topic}' Documentation\n\n{markdown_content}"
 
     except Exception as e:
-        logger.error(f"Error fetching documentation for topic '{topic}': {e}")
+        logger.error("Error fetching documentation for topic '%s': %s", topic, e)
 
         return (
             f"Unable to fetch detailed documentation for topic '{topic}' "
@@ -90,45 +159,212 @@ def _get_topic_specific_docs(topic: str) -> str:
         )
 
 
-def _is_manifest_only_connector(connector_name: str) -> bool:
-    """Check if a connector is manifest-only by querying the registry.
+def _is_manifest_only_entry(connector: dict[str, Any]) -> bool:
+    """Return whether a registry connector entry is manifest-only."""
+    language = connector.get("language")
+    tags = connector.get("tags", [])
 
-    Args:
-        connector_name: Name of the connector (e.g., 'source-faker')
+    return language == _MANIFEST_ONLY_LANGUAGE or f"language:{_MANIFEST_ONLY_LANGUAGE}" in tags
+
+
+def _index_registry(registry_data: dict[str, Any]) -> dict[str, bool]:
+    """Map registry connector names (e.g. 'source-faker') to their manifest-only flag.
+
+    Only the flag is kept, so the parsed registry can be freed once it is indexed.
+    If a name appears more than once, the first entry wins, sources before destinations.
+    """
+    index: dict[str, bool] = {}
+    for connector in itertools.chain(
+        registry_data.get("sources", []),
+        registry_data.get("destinations", []),
+    ):
+        connector_name = connector.get("dockerRepository", "").removeprefix("airbyte/")
+        if connector_name not in index:
+            index[connector_name] = _is_manifest_only_entry(connector)
+    return index
+
+
+def _get_registry_cache_path() -> Path:
+    """Get the path of the registry index persisted across server processes."""
+    return get_session_base_dir() / _REGISTRY_CACHE_FILENAME
+
+
+def _load_registry_disk_cache() -> _RegistrySnapshot | None:
+    """Load the registry index persisted by a previous process, if any.
+
+    The loaded snapshot is treated as expired, so it is revalidated against the
+    server (using its ETag) before use.
+    """
+    cache_path = _get_registry_cache_path()
+    try:
+        cached = json.loads(cache_path.read_bytes())
+        return _RegistrySnapshot(
+            index={str(name): bool(flag) for name, flag in cached["index"].items()},
+            fetched_at=float("-inf"),
+            etag=cached.get("etag"),
+            last_modified=cached.get("last_modified"),
+        )
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning("Ignoring unreadable registry cache at %s: %s", cache_path, e)
+        return None
+
+
+def _save_registry_disk_cache(snapshot: _RegistrySnapshot) -> None:
+    """Persist the registry index atomically so later processes can revalidate it."""
+    payload = json.dumps(
+        {
+            "etag": snapshot.etag,
+            "last_modified": snapshot.last_modified,
+            "index": snapshot.index,
+        }
+    )
+    cache_path = _get_registry_cache_path()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=cache_path.parent,
+            suffix=".tmp",
+            delete=False,
+        ) as tmp_file:
+            tmp_file.write(payload)
+        os.replace(tmp_file.name, cache_path)
+    except OSError as e:
+        logger.warning("Failed to write registry cache to %s: %s", cache_path, e)
+
+
+def _get_registry_index() -> dict[str, bool]:
+    """Return manifest-only flags by connector name, re-downloading at most once per TTL.
+
+    When the cached copy has expired, the request is sent with the stored ETag and
+    Last-Modified validators so an unchanged registry is revalidated with a 304
+    response instead of a full download. The index is also persisted on disk, so a
+    new server process starts by revalidating it rather than downloading it again.
+
+    Only one refresh runs at a time. While it is in flight, other callers get the
+    expired index if there is one, and otherwise wait for the refresh up to
+    `_REGISTRY_REFRESH_WAIT_SECONDS`. After a failed download, lookups fall back
+    to the expired index, or fail fast, until the failure backoff has elapsed.
 
     Returns:
-        True if the connector is manifest-only, False otherwise or on error
+        Manifest-only flags keyed by connector name
+
+    Raises:
+        RuntimeError: If no index is available and the registry cannot be fetched now
+        requests.RequestException: If the registry could not be downloaded
     """
+    global _registry_snapshot, _registry_refresh
+
+    with _registry_lock:
+        if _registry_snapshot is None:
+            _registry_snapshot = _load_registry_disk_cache()
+
+        snapshot = _registry_snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - snapshot.fetched_at < _REGISTRY_TTL_SECONDS:
+            return snapshot.index
+
+        refresh = _registry_refresh
+        in_backoff = (
+            _registry_failed_at is not None
+            and now - _registry_failed_at < _REGISTRY_FAILURE_BACKOFF_SECONDS
+        )
+        own_refresh: Future[dict[str, bool]] | None = None
+        if refresh is None and not in_backoff:
+            own_refresh = _registry_refresh = Future()
+
+    if own_refresh is None:
+        if snapshot is not None:
+            return snapshot.index
+        if refresh is None:
+            raise RuntimeError("The connector registry was unavailable recently; retrying later.")
+        try:
+            return refresh.result(timeout=_REGISTRY_REFRESH_WAIT_SECONDS)
+        except FutureTimeoutError:
+            raise RuntimeError("Timed out waiting for the connector registry download.") from None
+
     try:
-        response = requests.get(_REGISTRY_URL, timeout=30)
-        response.raise_for_status()
-        registry_data = response.json()
+        index = _refresh_registry(snapshot, now)
+    except BaseException as e:
+        own_refresh.set_exception(e)
+        raise
+    else:
+        own_refresh.set_result(index)
+        return index
+    finally:
+        with _registry_lock:
+            _registry_refresh = None
+
 
-        for connector_list in [
-            registry_data.get("sources", []),
-            registry_data.get("destinations", []),
-        ]:
-            for connector in connector_list:
-                docker_repo = connector.get("dockerRepository", "")
-                repo_connector_name = docker_repo.replace("airbyte/", "")
+def _refresh_registry(snapshot: _RegistrySnapshot | None, now: float) -> dict[str, bool]:
+    """Revalidate or re-download the registry and publish the result.
 
-                if repo_connector_name == connector_name:
-                    language = connector.get("language")
-                    tags = connector.get("tags", [])
+    Called without holding `_registry_lock`, which is only taken to publish the new
+    snapshot or record a failure, so lookups never wait on the network behind it.
+    """
+    global _registry_snapshot, _registry_failed_at
 
-                    return (
-                        language == _MANIFEST_ONLY_LANGUAGE
-                        or f"language:{_MANIFEST_ONLY_LANGUAGE}" in tags
-                    )
+    headers = {}
+    if snapshot is not None:
+        if snapshot.etag:
+            headers["If-None-Match"] = snapshot.etag
+        if snapshot.last_modified:
+            headers["If-Modified-Since"] = snapshot.last_modified
 
-    except Exception as e:
-        logger.warning(f"Failed to fetch registry data for {connector_name}: {e}")
-        return False
+    try:
+        response = _HTTP_SESSION.get(_REGISTRY_URL, headers=headers, timeout=30)
+        if snapshot is None or response.status_code != _HTTP_NOT_MODIFIED:
+            response.raise_for_status()
+    except requests.RequestException:
+        with _registry_lock:
+            _registry_failed_at = now
+        raise
+
+    if snapshot is not None and response.status_code == _HTTP_NOT_MODIFIED:
+        new_snapshot = _RegistrySnapshot(
+            index=snapshot.index,
+            fetched_at=now,
+            etag=snapshot.etag,
+            last_modified=snapshot.last_modified,
+        )
     else:
-        # No exception and no match found.
-        logger.info(f"Connector {connector_name} was not found in the registry.")
+        new_snapshot = _RegistrySnapshot(
+            index=_index_registry(json.loads(response.content)),
+            fetched_at=now,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        _save_registry_disk_cache(new_snapshot)
+
+    with _registry_lock:
+        _registry_failed_at = None
+        _registry_snapshot = new_snapshot
+    return new_snapshot.index
+
+
+def _is_manifest_only_connector(connector_name: str) -> bool:
+    """Check if a connector is manifest-only by querying the registry.
+
+    Args:
+        connector_name: Name of the connector (e.g., 'source-faker')
+
+    Returns:
+        True if the connector is manifest-only, False otherwise
+
+    Raises:
+        RuntimeError: If the registry is unavailable and no cached copy exists
+        requests.RequestException: If the registry could not be downloaded
+    """
+    is_manifest_only = _get_registry_index().get(connector_name)
+    if is_manifest_only is None:
+        logger.info("Connector %s was not found in the registry.", connector_name)
         return False
 
+    return is_manifest_only
+
 
 @mcp_tool(
     domain=ToolDomain.GUIDANCE,
@@ -154,27 +390,36 @@ def get_connector_manifest(
     Returns:
         Raw YAML content of the connector manifest
     """
-    logger.info(f"Getting connector manifest for {connector_name} version {version}")
+    logger.info("Getting connector manifest for %s version %s", connector_name, version)
 
     cleaned_version = version.removeprefix("v")
-    is_manifest_only = _is_manifest_only_connector(connector_name)
+    manifest_url = f"https://connectors.airbyte.com/metadata/airbyte/{connector_name}/{cleaned_version}/manifest.yaml"
+
+    try:
+        is_manifest_only = _is_manifest_only_connector(connector_name)
+    except Exception as e:
+        logger.warning("Failed to fetch registry data for %s: %s", connector_name, e)
+        return (
+            "ERROR: The connector registry is unavailable, so it could not be checked whether "
+            f"'{connector_name}' is manifest-only. Please retry later.\n\nError: {e!s}"
+        )
 
     logger.info(
-        f"Connector {connector_name} is {'manifest-only' if is_manifest_only else 'not manifest-only'}."
+        "Connector %s is %s.",
+        connector_name,
+        "manifest-only" if is_manifest_only else "not manifest-only",
     )
     if not is_manifest_only:
         return "ERROR: This connector is not manifest-only."
 
-    manifest_url = f"https://connectors.airbyte.com/metadata/airbyte/{connector_name}/{cleaned_version}/manifest.yaml"
-
     try:
-        response = requests.get(manifest_url, timeout=30)
+        response = _HTTP_SESSION.get(manifest_url, timeout=30)
         response.raise_for_status()
 
         return response.text
 
     except Exception as e:
-        logger.error(f"Error fetching connector manifest for {connector_name}: {e}")
+        logger.error("Error fetching connector manifest for %s: %s", connector_name, e)
         return (
             f"# Error fetching manifest for connector '{connector_name}' version "
             f"'{version}' from {manifest_url}\n\nError: {str(e)}"
@@ -196,7 +441,7 @@ def _get_manifest_yaml_json_schema() -> str:
         "User-Agent": "connector-schema-tool",
     }
 
-    response = requests.get(
+    response = _HTTP_SESSION.get(
         _MANIFEST_SCHEMA_URL,
         headers=headers,
         timeout=30,
@@ -280,4 +525,4 @@ def register_guidance_tools(
     app: FastMCP,
 ):
     """Register guidance tools in the MCP server."""
-    register_mcp_tools(app, domain=ToolDomain.GUIDANCE)
+    register_mcp_tools(app, domain=ToolDomain.GUIDANCE, package=__package__)
@@ -96,4 +96,4 @@ def register_validation_tools(app) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_tools(app, domain=ToolDomain.VALIDATION)
+    register_mcp_tools(app, domain=ToolDomain.VALIDATION, package=__package__)
@@ -43,6 +43,7 @@ from connector_builder_mcp._util import (
     parse_manifest_input,
 )
 from connector_builder_mcp._validation_helpers import validate_manifest_content
+from connector_builder_mcp.build_strategies.base import common_fields
 from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_mcp_tools
 from connector_builder_mcp.mcp.manifest_edits import (
     get_session_manifest_content,
@@ -551,7 +552,7 @@ def execute_stream_test_read(  # noqa: PLR0914
     *,
     stream_name: Annotated[
         str,
-        Field(description="Name of the stream to test"),
+        common_fields.STREAM_NAME_FIELD,
     ],
     manifest: Annotated[
         str | None,
@@ -566,7 +567,7 @@ def execute_stream_test_read(  # noqa: PLR0914
     ] = None,
     max_records: Annotated[
         int,
-        Field(description="Maximum number of records to read", ge=1),
+        common_fields.MAX_RECORDS_FIELD,
     ] = 10,
     include_records_data: Annotated[
         bool | str,
@@ -1223,4 +1224,4 @@ def register_testing_tools(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_tools(app, domain=ToolDomain.TESTING)
+    register_mcp_tools(app, domain=ToolDomain.TESTING, package=__package__)
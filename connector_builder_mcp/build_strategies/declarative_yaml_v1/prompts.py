@@ -137,4 +137,4 @@ def register_prompts(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_prompts(app, domain=ToolDomain.PROMPTS)
+    register_mcp_prompts(app, domain=ToolDomain.PROMPTS, package=__package__)
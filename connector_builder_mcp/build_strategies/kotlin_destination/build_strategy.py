@@ -5,18 +5,14 @@ This strategy supports building Airbyte destination connectors using Kotlin.
 
 from __future__ import annotations
 
-import shutil
-import subprocess
-
-from fastmcp import FastMCP
+from typing import TYPE_CHECKING
 
 from connector_builder_mcp.build_strategies.base.build_strategy import BuildStrategy
-from connector_builder_mcp.build_strategies.kotlin_destination import (
-    guidance,
-    manifest_checks,
-    manifest_tests,
-    prompts,
-)
+from connector_builder_mcp.build_strategies.base.java_runtime import is_java_21_available
+
+
+if TYPE_CHECKING:
+    from fastmcp import FastMCP
 
 
 class KotlinDestinationStrategy(BuildStrategy):
@@ -34,40 +30,34 @@ class KotlinDestinationStrategy(BuildStrategy):
     def is_available(cls) -> bool:
         """Check if Java 21 is available.
 
-        Returns True if Java 21 is installed and available.
+        Returns True if Java 21 is installed and available (see `is_java_21_available`).
         """
-        java_path = shutil.which("java")
-        if not java_path:
-            return False
-
-        try:
-            result = subprocess.run(
-                ["java", "-version"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            version_output = result.stderr + result.stdout
-            return "21" in version_output or "openjdk 21" in version_output.lower()
-        except (subprocess.TimeoutExpired, subprocess.SubprocessError):
-            return False
+        return is_java_21_available()
 
     @classmethod
     def register_guidance_tools(cls, app: FastMCP) -> None:
         """Register guidance tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.kotlin_destination import guidance
+
         guidance.register_guidance_tools(app)
 
     @classmethod
     def register_validation_tools(cls, app: FastMCP) -> None:
         """Register validation tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.kotlin_destination import manifest_checks
+
         manifest_checks.register_validation_tools(app)
 
     @classmethod
     def register_testing_tools(cls, app: FastMCP) -> None:
         """Register testing tools by calling the registration function."""
+        from connector_builder_mcp.build_strategies.kotlin_destination import manifest_tests
+
         manifest_tests.register_testing_tools(app)
 
     @classmethod
     def register_prompts(cls, app: FastMCP) -> None:
         """Register prompts by calling the registration function."""
+        from connector_builder_mcp.build_strategies.kotlin_destination import prompts
+
         prompts.register_prompts(app)
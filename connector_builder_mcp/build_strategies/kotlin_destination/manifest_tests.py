@@ -8,8 +8,9 @@ import logging
 from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from connector_builder_mcp.build_strategies.base import common_fields
 from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_mcp_tools
 
 
@@ -19,10 +20,30 @@ logger = logging.getLogger(__name__)
 class KotlinDestinationTestResult(BaseModel):
     """Result of Kotlin destination testing operation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     success: bool
     message: str
     records_written: int = 0
-    errors: list[str] = []
+    errors: tuple[str, ...] = ()
+
+
+# Prebuilt results for the constant error paths of `test_kotlin_destination_write`.
+_NO_PROJECT_PATH_ERROR = KotlinDestinationTestResult.model_construct(
+    success=False,
+    message="No project path provided",
+    errors=("No project path provided",),
+)
+_NO_CONFIG_ERROR = KotlinDestinationTestResult.model_construct(
+    success=False,
+    message="No configuration provided",
+    errors=("Configuration with credentials is required for testing",),
+)
+_NO_TEST_RECORDS_ERROR = KotlinDestinationTestResult.model_construct(
+    success=False,
+    message="No test records provided",
+    errors=("Test records are required for testing write operations",),
+)
 
 
 @mcp_tool(
@@ -34,15 +55,15 @@ def test_kotlin_destination_write(
     *,
     stream_name: Annotated[
         str,
-        Field(description="Name of the stream to test"),
+        common_fields.STREAM_NAME_FIELD,
     ],
     project_path: Annotated[
         str | None,
-        Field(description="Path to the Kotlin destination connector project directory"),
+        common_fields.KOTLIN_DESTINATION_PROJECT_PATH_FIELD,
     ] = None,
     config: Annotated[
         dict[str, Any] | str | None,
-        Field(description="Connector configuration dictionary (including auth credentials)."),
+        common_fields.CONFIG_FIELD,
     ] = None,
     test_records: Annotated[
         list[dict[str, Any]] | None,
@@ -61,34 +82,21 @@ def test_kotlin_destination_write(
     Returns:
         Test result with success status and any errors
     """
-    logger.info(f"Testing Kotlin destination write for stream: {stream_name}")
+    logger.info("Testing Kotlin destination write for stream: %s", stream_name)
 
     if project_path is None:
-        return KotlinDestinationTestResult(
-            success=False,
-            message="No project path provided",
-            errors=["No project path provided"],
-        )
+        return _NO_PROJECT_PATH_ERROR
 
     if config is None:
-        return KotlinDestinationTestResult(
-            success=False,
-            message="No configuration provided",
-            errors=["Configuration with credentials is required for testing"],
-        )
+        return _NO_CONFIG_ERROR
 
     if test_records is None or len(test_records) == 0:
-        return KotlinDestinationTestResult(
-            success=False,
-            message="No test records provided",
-            errors=["Test records are required for testing write operations"],
-        )
+        return _NO_TEST_RECORDS_ERROR
 
     return KotlinDestinationTestResult(
         success=True,
         message=f"Successfully tested write to stream '{stream_name}' (placeholder implementation)",
         records_written=0,
-        errors=[],
     )
 
 
@@ -98,4 +106,4 @@ def register_testing_tools(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_tools(app, domain=ToolDomain.TESTING)
+    register_mcp_tools(app, domain=ToolDomain.TESTING, package=__package__)
@@ -5,6 +5,7 @@ This module provides pre-built instruction templates that guide users through
 building Kotlin-based destination connectors.
 """
 
+from functools import lru_cache
 from typing import Annotated
 
 from fastmcp import FastMCP
@@ -17,36 +18,7 @@ from connector_builder_mcp.mcp._mcp_utils import (
 )
 
 
-@mcp_prompt(
-    name="new_kotlin_destination_connector",
-    description="Build a Kotlin-based destination connector",
-    domain=ToolDomain.PROMPTS,
-)
-def new_kotlin_destination_connector_prompt(
-    destination_name: Annotated[
-        str | None,
-        Field(
-            description="Optional destination system name",
-            default=None,
-        ),
-    ] = None,
-    additional_requirements: Annotated[
-        str | None,
-        Field(
-            description="Optional additional requirements for the connector",
-            default=None,
-        ),
-    ] = None,
-) -> list[dict[str, str]]:
-    """Prompt for building a Kotlin-based destination connector.
-
-    Returns:
-        List of message dictionaries for the prompt
-    """
-    destination_name = destination_name or "Example Destination"
-    additional_requirements = additional_requirements or "(none)"
-
-    content = f"""# Build Kotlin Destination Connector
+_NEW_KOTLIN_DESTINATION_CONNECTOR_PROMPT = """# Build Kotlin Destination Connector
 
 Build an Airbyte destination connector for **{destination_name}** using Kotlin.
 
@@ -86,6 +58,54 @@ Call `get_kotlin_destination_connector_docs()` for detailed guidance on:
 
 Begin by getting the checklist and understanding the workflow.
 """
+"""Template for the new Kotlin destination connector prompt.
+
+Placeholders: `destination_name`, `additional_requirements`.
+"""
+
+
+@lru_cache(maxsize=128)
+def _render_prompt(destination_name: str, additional_requirements: str) -> str:
+    """Render the new Kotlin destination connector prompt content.
+
+    Results are cached per argument pair, since most calls use the defaults.
+    """
+    return _NEW_KOTLIN_DESTINATION_CONNECTOR_PROMPT.format(
+        destination_name=destination_name,
+        additional_requirements=additional_requirements,
+    )
+
+
+@mcp_prompt(
+    name="new_kotlin_destination_connector",
+    description="Build a Kotlin-based destination connector",
+    domain=ToolDomain.PROMPTS,
+)
+def new_kotlin_destination_connector_prompt(
+    destination_name: Annotated[
+        str | None,
+        Field(
+            description="Optional destination system name",
+            default=None,
+        ),
+    ] = None,
+    additional_requirements: Annotated[
+        str | None,
+        Field(
+            description="Optional additional requirements for the connector",
+            default=None,
+        ),
+    ] = None,
+) -> list[dict[str, str]]:
+    """Prompt for building a Kotlin-based destination connector.
+
+    Returns:
+        List of message dictionaries for the prompt
+    """
+    destination_name = destination_name or "Example Destination"
+    additional_requirements = additional_requirements or "(none)"
+
+    content = _render_prompt(destination_name, additional_requirements)
 
     return [{"role": "user", "content": content}]
 
@@ -96,4 +116,4 @@ def register_prompts(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_prompts(app, domain=ToolDomain.PROMPTS)
+    register_mcp_prompts(app, domain=ToolDomain.PROMPTS, package=__package__)
@@ -5,6 +5,8 @@ building Kotlin-based source connectors.
 """
 
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Annotated
 
 from fastmcp import FastMCP
@@ -16,29 +18,7 @@ from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_
 logger = logging.getLogger(__name__)
 
 
-@mcp_tool(
-    domain=ToolDomain.GUIDANCE,
-)
-def get_kotlin_source_connector_docs(
-    topic: Annotated[
-        str | None,
-        Field(
-            description="Specific topic to get detailed documentation for. If not provided, returns high-level overview."
-        ),
-    ] = None,
-) -> str:
-    """Get Kotlin source connector builder documentation and guidance.
-
-    Args:
-        topic: Optional specific topic for detailed documentation
-
-    Returns:
-        High-level overview or detailed topic-specific documentation
-    """
-    logger.info(f"Getting Kotlin source connector docs for topic: {topic}")
-
-    if not topic:
-        return """# Kotlin Source Connector Builder Documentation
+_OVERVIEW_DOC = """# Kotlin Source Connector Builder Documentation
 
 **Important**: Before starting development, call the `get_connector_builder_checklist()` tool.
 The checklist provides step-by-step guidance for building Kotlin-based source connectors.
@@ -74,8 +54,10 @@ For detailed guidance on specific aspects, request documentation for:
 - **incremental_sync**: Implementing incremental syncs
 - **error_handling**: Error handling best practices
 """
+"""High-level overview returned when no topic is requested."""
 
-    topic_docs = {
+_TOPIC_DOCS: Mapping[str, str] = MappingProxyType(
+    {
         "kotlin_source_overview": """# Kotlin Source Connector Development Overview
 
 Kotlin source connectors provide full programmatic control over data extraction
@@ -297,15 +279,46 @@ override fun parseResponse(
 ```
 """,
     }
+)
+"""Detailed documentation keyed by topic name."""
+
+_AVAILABLE_TOPICS = ", ".join(_TOPIC_DOCS)
+"""Comma-separated topic names, used in the "topic not found" message."""
+
+
+@mcp_tool(
+    domain=ToolDomain.GUIDANCE,
+)
+def get_kotlin_source_connector_docs(
+    topic: Annotated[
+        str | None,
+        Field(
+            description="Specific topic to get detailed documentation for. If not provided, returns high-level overview."
+        ),
+    ] = None,
+) -> str:
+    """Get Kotlin source connector builder documentation and guidance.
+
+    Args:
+        topic: Optional specific topic for detailed documentation
+
+    Returns:
+        High-level overview or detailed topic-specific documentation
+    """
+    logger.info(f"Getting Kotlin source connector docs for topic: {topic}")
+
+    if not topic:
+        return _OVERVIEW_DOC
 
-    if topic in topic_docs:
-        return topic_docs[topic]
+    doc = _TOPIC_DOCS.get(topic)
+    if doc is not None:
+        return doc
 
-    return f"# {topic} Documentation\n\nTopic '{topic}' not found. Available topics: {', '.join(topic_docs.keys())}"
+    return f"# {topic} Documentation\n\nTopic '{topic}' not found. Available topics: {_AVAILABLE_TOPICS}"
 
 
 def register_guidance_tools(
     app: FastMCP,
 ):
     """Register guidance tools in the MCP server."""
-    register_mcp_tools(app, domain=ToolDomain.GUIDANCE)
+    register_mcp_tools(app, domain=ToolDomain.GUIDANCE, package=__package__)
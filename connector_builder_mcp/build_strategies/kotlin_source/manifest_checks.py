@@ -8,8 +8,9 @@ import logging
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 
+from connector_builder_mcp.build_strategies.base import common_fields
 from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_mcp_tools
 
 
@@ -19,10 +20,19 @@ logger = logging.getLogger(__name__)
 class KotlinSourceValidationResult(BaseModel):
     """Result of Kotlin source connector validation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     is_valid: bool
-    errors: list[str] = []
-    warnings: list[str] = []
-    streams_found: list[str] = []
+    errors: tuple[str, ...] = ()
+    warnings: tuple[str, ...] = ()
+    streams_found: tuple[str, ...] = ()
+
+
+# Prebuilt result for the missing-project-path branch of `validate_kotlin_source_connector`.
+_NO_PROJECT_PATH_ERROR = KotlinSourceValidationResult.model_construct(
+    is_valid=False,
+    errors=("No project path provided",),
+)
 
 
 @mcp_tool(
@@ -36,7 +46,7 @@ def validate_kotlin_source_connector(
     *,
     project_path: Annotated[
         str | None,
-        Field(description="Path to the Kotlin source connector project directory"),
+        common_fields.KOTLIN_SOURCE_PROJECT_PATH_FIELD,
     ] = None,
 ) -> KotlinSourceValidationResult:
     """Validate a Kotlin source connector project structure and code.
@@ -51,11 +61,7 @@ def validate_kotlin_source_connector(
     logger.info("Validating Kotlin source connector")
 
     if project_path is None:
-        return KotlinSourceValidationResult(
-            is_valid=False,
-            errors=["No project path provided"],
-            warnings=[],
-        )
+        return _NO_PROJECT_PATH_ERROR
 
     errors: list[str] = []
     warnings: list[str] = []
@@ -65,11 +71,11 @@ def validate_kotlin_source_connector(
 
     is_valid = len(errors) == 0
 
-    return KotlinSourceValidationResult(
+    return KotlinSourceValidationResult.model_construct(
         is_valid=is_valid,
-        errors=errors,
-        warnings=warnings,
-        streams_found=streams_found,
+        errors=tuple(errors),
+        warnings=tuple(warnings),
+        streams_found=tuple(streams_found),
     )
 
 
@@ -79,4 +85,4 @@ def register_validation_tools(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_tools(app, domain=ToolDomain.VALIDATION)
+    register_mcp_tools(app, domain=ToolDomain.VALIDATION, package=__package__)
@@ -8,8 +8,9 @@ import logging
 from typing import Annotated, Any
 
 from fastmcp import Context, FastMCP
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+from connector_builder_mcp.build_strategies.base import common_fields
 from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_mcp_tools
 
 
@@ -19,37 +20,71 @@ logger = logging.getLogger(__name__)
 class KotlinBuildResult(BaseModel):
     """Result of Kotlin connector build operation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     success: bool
     message: str
-    errors: list[str] = []
-    warnings: list[str] = []
+    errors: tuple[str, ...] = ()
+    warnings: tuple[str, ...] = ()
     build_output: str | None = None
 
 
 class KotlinTestResult(BaseModel):
     """Result of Kotlin test execution."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     success: bool
     message: str
     tests_run: int = 0
     tests_passed: int = 0
     tests_failed: int = 0
-    errors: list[str] = []
+    errors: tuple[str, ...] = ()
     test_output: str | None = None
 
 
 class KotlinStreamTestResult(BaseModel):
     """Result of Kotlin stream testing operation."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid", validate_assignment=False)
+
     success: bool
     message: str
     records_read: int = 0
-    errors: list[str] = []
+    errors: tuple[str, ...] = ()
     records: list[dict[str, Any]] | None = Field(
         default=None, description="Actual record data from the stream"
     )
 
 
+# Prebuilt results for the constant error paths of the testing tools.
+_NO_PROJECT_PATH_BUILD_ERROR = KotlinBuildResult.model_construct(
+    success=False,
+    message="No project path provided",
+    errors=("No project path provided",),
+)
+_NO_PROJECT_PATH_TEST_ERROR = KotlinTestResult.model_construct(
+    success=False,
+    message="No project path provided",
+    errors=("No project path provided",),
+)
+_NO_CONFIG_INTEGRATION_TEST_ERROR = KotlinTestResult.model_construct(
+    success=False,
+    message="No configuration provided",
+    errors=("Configuration with credentials is required for integration tests",),
+)
+_NO_PROJECT_PATH_STREAM_TEST_ERROR = KotlinStreamTestResult.model_construct(
+    success=False,
+    message="No project path provided",
+    errors=("No project path provided",),
+)
+_NO_CONFIG_STREAM_TEST_ERROR = KotlinStreamTestResult.model_construct(
+    success=False,
+    message="No configuration provided",
+    errors=("Configuration with credentials is required for testing",),
+)
+
+
 @mcp_tool(
     domain=ToolDomain.TESTING,
     open_world=True,
@@ -59,7 +94,7 @@ def compile_and_build(
     *,
     project_path: Annotated[
         str | None,
-        Field(description="Path to the Kotlin source connector project directory"),
+        common_fields.KOTLIN_SOURCE_PROJECT_PATH_FIELD,
     ] = None,
 ) -> KotlinBuildResult:
     """Compile and build a Kotlin source connector project.
@@ -74,17 +109,13 @@ def compile_and_build(
     logger.info("Compiling and building Kotlin source connector")
 
     if project_path is None:
-        return KotlinBuildResult(
-            success=False,
-            message="No project path provided",
-            errors=["No project path provided"],
-        )
+        return _NO_PROJECT_PATH_BUILD_ERROR
 
-    return KotlinBuildResult(
+    return KotlinBuildResult.model_construct(
         success=True,
         message="Successfully compiled and built connector (placeholder implementation)",
-        errors=[],
-        warnings=["Kotlin build is a placeholder implementation"],
+        errors=(),
+        warnings=("Kotlin build is a placeholder implementation",),
     )
 
 
@@ -97,7 +128,7 @@ def run_unit_tests(
     *,
     project_path: Annotated[
         str | None,
-        Field(description="Path to the Kotlin source connector project directory"),
+        common_fields.KOTLIN_SOURCE_PROJECT_PATH_FIELD,
     ] = None,
 ) -> KotlinTestResult:
     """Run unit tests for a Kotlin source connector project.
@@ -112,19 +143,15 @@ def run_unit_tests(
     logger.info("Running unit tests for Kotlin source connector")
 
     if project_path is None:
-        return KotlinTestResult(
-            success=False,
-            message="No project path provided",
-            errors=["No project path provided"],
-        )
+        return _NO_PROJECT_PATH_TEST_ERROR
 
-    return KotlinTestResult(
+    return KotlinTestResult.model_construct(
         success=True,
         message="Successfully ran unit tests (placeholder implementation)",
         tests_run=0,
         tests_passed=0,
         tests_failed=0,
-        errors=[],
+        errors=(),
     )
 
 
@@ -137,11 +164,11 @@ def run_integration_tests(
     *,
     project_path: Annotated[
         str | None,
-        Field(description="Path to the Kotlin source connector project directory"),
+        common_fields.KOTLIN_SOURCE_PROJECT_PATH_FIELD,
     ] = None,
     config: Annotated[
         dict[str, Any] | str | None,
-        Field(description="Connector configuration dictionary (including auth credentials)."),
+        common_fields.CONFIG_FIELD,
     ] = None,
 ) -> KotlinTestResult:
     """Run integration tests for a Kotlin source connector project.
@@ -157,26 +184,18 @@ def run_integration_tests(
     logger.info("Running integration tests for Kotlin source connector")
 
     if project_path is None:
-        return KotlinTestResult(
-            success=False,
-            message="No project path provided",
-            errors=["No project path provided"],
-        )
+        return _NO_PROJECT_PATH_TEST_ERROR
 
     if config is None:
-        return KotlinTestResult(
-            success=False,
-            message="No configuration provided",
-            errors=["Configuration with credentials is required for integration tests"],
-        )
+        return _NO_CONFIG_INTEGRATION_TEST_ERROR
 
-    return KotlinTestResult(
+    return KotlinTestResult.model_construct(
         success=True,
         message="Successfully ran integration tests (placeholder implementation)",
         tests_run=0,
         tests_passed=0,
         tests_failed=0,
-        errors=[],
+        errors=(),
     )
 
 
@@ -189,19 +208,19 @@ def test_kotlin_source_stream(
     *,
     stream_name: Annotated[
         str,
-        Field(description="Name of the stream to test"),
+        common_fields.STREAM_NAME_FIELD,
     ],
     project_path: Annotated[
         str | None,
-        Field(description="Path to the Kotlin source connector project directory"),
+        common_fields.KOTLIN_SOURCE_PROJECT_PATH_FIELD,
     ] = None,
     config: Annotated[
         dict[str, Any] | str | None,
-        Field(description="Connector configuration dictionary (including auth credentials)."),
+        common_fields.CONFIG_FIELD,
     ] = None,
     max_records: Annotated[
         int,
-        Field(description="Maximum number of records to read", ge=1),
+        common_fields.MAX_RECORDS_FIELD,
     ] = 10,
 ) -> KotlinStreamTestResult:
     """Test reading data from a Kotlin source connector stream.
@@ -219,24 +238,16 @@ def test_kotlin_source_stream(
     logger.info(f"Testing Kotlin source stream: {stream_name}")
 
     if project_path is None:
-        return KotlinStreamTestResult(
-            success=False,
-            message="No project path provided",
-            errors=["No project path provided"],
-        )
+        return _NO_PROJECT_PATH_STREAM_TEST_ERROR
 
     if config is None:
-        return KotlinStreamTestResult(
-            success=False,
-            message="No configuration provided",
-            errors=["Configuration with credentials is required for testing"],
-        )
+        return _NO_CONFIG_STREAM_TEST_ERROR
 
-    return KotlinStreamTestResult(
+    return KotlinStreamTestResult.model_construct(
         success=True,
         message=f"Successfully tested stream '{stream_name}' (placeholder implementation)",
         records_read=0,
-        errors=[],
+        errors=(),
         records=[],
     )
 
@@ -247,4 +258,4 @@ def register_testing_tools(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_tools(app, domain=ToolDomain.TESTING)
+    register_mcp_tools(app, domain=ToolDomain.TESTING, package=__package__)
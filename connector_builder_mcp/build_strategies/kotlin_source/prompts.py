@@ -5,6 +5,7 @@ This module provides pre-built instruction templates that guide users through
 building Kotlin-based source connectors.
 """
 
+from functools import lru_cache
 from typing import Annotated
 
 from fastmcp import FastMCP
@@ -17,36 +18,7 @@ from connector_builder_mcp.mcp._mcp_utils import (
 )
 
 
-@mcp_prompt(
-    name="new_kotlin_source_connector",
-    description="Build a Kotlin-based source connector",
-    domain=ToolDomain.PROMPTS,
-)
-def new_kotlin_source_connector_prompt(
-    api_name: Annotated[
-        str | None,
-        Field(
-            description="Optional API name",
-            default=None,
-        ),
-    ] = None,
-    additional_requirements: Annotated[
-        str | None,
-        Field(
-            description="Optional additional requirements for the connector",
-            default=None,
-        ),
-    ] = None,
-) -> list[dict[str, str]]:
-    """Prompt for building a Kotlin-based source connector.
-
-    Returns:
-        List of message dictionaries for the prompt
-    """
-    api_name = api_name or "Example API"
-    additional_requirements = additional_requirements or "(none)"
-
-    content = f"""# Build Kotlin Source Connector
+_NEW_KOTLIN_SOURCE_CONNECTOR_PROMPT = """# Build Kotlin Source Connector
 
 Build an Airbyte source connector for **{api_name}** using Kotlin.
 
@@ -85,6 +57,54 @@ Call `get_kotlin_source_connector_docs()` for detailed guidance on:
 
 Begin by getting the checklist and understanding the workflow.
 """
+"""Template for the new Kotlin source connector prompt.
+
+Placeholders: `api_name`, `additional_requirements`.
+"""
+
+
+@lru_cache(maxsize=128)
+def _render_prompt(api_name: str, additional_requirements: str) -> str:
+    """Render the new Kotlin source connector prompt content.
+
+    Results are cached per argument pair, since most calls use the defaults.
+    """
+    return _NEW_KOTLIN_SOURCE_CONNECTOR_PROMPT.format(
+        api_name=api_name,
+        additional_requirements=additional_requirements,
+    )
+
+
+@mcp_prompt(
+    name="new_kotlin_source_connector",
+    description="Build a Kotlin-based source connector",
+    domain=ToolDomain.PROMPTS,
+)
+def new_kotlin_source_connector_prompt(
+    api_name: Annotated[
+        str | None,
+        Field(
+            description="Optional API name",
+            default=None,
+        ),
+    ] = None,
+    additional_requirements: Annotated[
+        str | None,
+        Field(
+            description="Optional additional requirements for the connector",
+            default=None,
+        ),
+    ] = None,
+) -> list[dict[str, str]]:
+    """Prompt for building a Kotlin-based source connector.
+
+    Returns:
+        List of message dictionaries for the prompt
+    """
+    api_name = api_name or "Example API"
+    additional_requirements = additional_requirements or "(none)"
+
+    content = _render_prompt(api_name, additional_requirements)
 
     return [{"role": "user", "content": content}]
 
@@ -95,4 +115,4 @@ def register_prompts(app: FastMCP) -> None:
     Args:
         app: FastMCP application instance
     """
-    register_mcp_prompts(app, domain=ToolDomain.PROMPTS)
+    register_mcp_prompts(app, domain=ToolDomain.PROMPTS, package=__package__)
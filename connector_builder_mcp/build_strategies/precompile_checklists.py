@@ -0,0 +1,48 @@
+"""Precompile each build strategy's checklist YAML into a JSON sidecar.
+
+`BuildStrategy.load_checklist_yaml()` prefers the JSON sidecar when it is at least
+as new as the YAML file, which avoids YAML parsing on cold start.
+
+Wheels are built with the same sidecars by the hatch build hook in `hatch_build.py`.
+This entry point writes them into a development checkout, where they are gitignored.
+
+Usage:
+    python -m connector_builder_mcp.build_strategies.precompile_checklists
+"""
+
+from __future__ import annotations
+
+import sys
+
+from connector_builder_mcp.build_strategies.base.build_strategy import BuildStrategy
+from connector_builder_mcp.build_strategies.declarative_openapi_v3.build_strategy import (
+    DeclarativeOpenApiV3Strategy,
+)
+from connector_builder_mcp.build_strategies.declarative_yaml_v1.build_strategy import (
+    DeclarativeYamlV1Strategy,
+)
+from connector_builder_mcp.build_strategies.kotlin_destination.build_strategy import (
+    KotlinDestinationStrategy,
+)
+from connector_builder_mcp.build_strategies.kotlin_source.build_strategy import (
+    KotlinSourceStrategy,
+)
+
+
+ALL_STRATEGIES: list[type[BuildStrategy]] = [
+    DeclarativeYamlV1Strategy,
+    DeclarativeOpenApiV3Strategy,
+    KotlinSourceStrategy,
+    KotlinDestinationStrategy,
+]
+
+
+def main() -> None:
+    """Write the checklist JSON sidecar for every build strategy."""
+    for strategy in ALL_STRATEGIES:
+        json_path = strategy.write_checklist_json_cache()
+        print(f"  - {strategy.name}: {json_path}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@ This module contains configuration constants and environment variable names
 used throughout the Connector Builder MCP server.
 """
 
+import functools
 import os
 import tempfile
 from pathlib import Path
@@ -16,18 +17,23 @@ If set, this environment variable specifies the directory where session-specific
 manifest files will be stored. If not set, defaults to a temporary directory.
 """
 
-SESSION_BASE_DIR = Path(
-    os.environ.get(
-        CONNECTOR_BUILDER_MCP_SESSIONS_DIR,
-        str(Path(tempfile.gettempdir()) / "connector-builder-mcp-sessions"),
-    )
-)
-"""Base directory for session-specific file storage.
-
-This directory is used to store session-isolated manifest files and other
-session-specific data. Each session gets its own subdirectory based on
-a hashed session ID.
-"""
+
+@functools.cache
+def get_session_base_dir() -> Path:
+    """Get the base directory for session-specific file storage.
+
+    This directory is used to store session-isolated manifest files and other
+    session-specific data. Each session gets its own subdirectory based on
+    a hashed session ID.
+
+    The directory is resolved on first use (from CONNECTOR_BUILDER_MCP_SESSIONS_DIR,
+    or else a subdirectory of the system temp directory) and cached afterwards.
+    """
+    sessions_dir = os.environ.get(CONNECTOR_BUILDER_MCP_SESSIONS_DIR)
+    if sessions_dir:
+        return Path(sessions_dir)
+    return Path(tempfile.gettempdir()) / "connector-builder-mcp-sessions"
+
 
 MCP_SERVER_NAME = os.environ.get("CONNECTOR_BUILDER_MCP_SERVER_NAME", "connector-builder-mcp")
 """MCP server name used for server identification and resource URIs.
@@ -54,6 +60,14 @@ Valid values:
 Example: CONNECTOR_BUILDER_STRATEGY=kotlin_source
 """
 
+CONNECTOR_BUILDER_SKIP_JAVA_PROBE = "CONNECTOR_BUILDER_SKIP_JAVA_PROBE"
+"""Environment variable name for skipping the Java 21 availability probe.
+
+If set to "1" or "true", the Kotlin build strategies do not shell out to
+`java -version` and report Java 21 as unavailable (unless `JAVA_VERSION` already
+reports Java 21). Useful in CI environments where the Kotlin strategies are unused.
+"""
+
 REQUIRE_SESSION_MANIFEST_IN_TOOL_CALLS = True
 """Whether to require a session manifest for tool calls.
 
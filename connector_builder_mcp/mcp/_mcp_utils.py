@@ -8,6 +8,8 @@ for deferred registration.
 from __future__ import annotations
 
 import inspect
+import weakref
+from collections import defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
@@ -80,12 +82,20 @@ class ToolDomain(str, Enum):
     """Prompt templates for common workflows"""
 
 
-_REGISTERED_TOOLS: list[tuple[Callable[..., Any], dict[str, Any]]] = []
-_REGISTERED_RESOURCES: list[tuple[Callable[..., Any], dict[str, Any]]] = []
-_REGISTERED_PROMPTS: list[tuple[Callable[..., Any], dict[str, Any]]] = []
+_RegistryIndex = defaultdict[str | None, list[tuple[Callable[..., Any], dict[str, Any]]]]
+"""Deferred callables and their annotations, indexed by domain at decoration time."""
+
+_REGISTERED_TOOLS: _RegistryIndex = defaultdict(list)
+_REGISTERED_RESOURCES: _RegistryIndex = defaultdict(list)
+_REGISTERED_PROMPTS: _RegistryIndex = defaultdict(list)
 # PROMPT_REGISTRY: dict[str, PromptDef] = {}
 # RESOURCE_REGISTRY: dict[str, ResourceDef] = {}
 
+_APP_REGISTERED_CALLABLES: weakref.WeakKeyDictionary[FastMCP, set[Callable[..., Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+"""Callables already registered with each app, so repeated registration calls are no-ops."""
+
 
 def should_register_tool(annotations: dict[str, Any]) -> bool:
     """Check if a tool should be registered.
@@ -143,7 +153,7 @@ def mcp_tool(
         if extra_help_text:
             func.__doc__ = ((func.__doc__ or "") + "\n\n" + (extra_help_text or "")).rstrip()
 
-        _REGISTERED_TOOLS.append((func, annotations))
+        _REGISTERED_TOOLS[domain_str].append((func, annotations))
         return func
 
     return decorator
@@ -176,7 +186,7 @@ def mcp_prompt(
         }
         if domain_str is not None:
             annotations["domain"] = domain_str
-        _REGISTERED_PROMPTS.append((func, annotations))
+        _REGISTERED_PROMPTS[domain_str].append((func, annotations))
         return func
 
     return decorator
@@ -212,7 +222,7 @@ def mcp_resource(
         }
         if domain_str is not None:
             annotations["domain"] = domain_str
-        _REGISTERED_RESOURCES.append((func, annotations))
+        _REGISTERED_RESOURCES[domain_str].append((func, annotations))
         return func
 
     return decorator
@@ -222,36 +232,50 @@ def _register_mcp_callables(
     *,
     app: FastMCP,
     domain: ToolDomain | str,
-    resource_list: list[tuple[Callable, dict]],
+    registry: _RegistryIndex,
     register_fn: Callable,
+    package: str | None = None,
 ) -> None:
     """Register resources and tools with the FastMCP app, filtered by domain.
 
+    Callables that were already registered with the same app are skipped, so calling
+    this more than once per app (e.g. in tests) does not repeat FastMCP registration.
+
     Args:
         app: The FastMCP app instance
         domain: The domain to register tools for (e.g., ToolDomain.SESSION, "session")
-        resource_list: List of (callable, annotations) tuples to register
+        registry: Domain-indexed (callable, annotations) tuples to register
         register_fn: Function to call for each registration
+        package: If given, only register callables defined in this package. Build
+            strategies share domains, so this keeps one strategy from registering
+            another strategy's callables that happen to be imported.
     """
     domain_str = domain.value if isinstance(domain, ToolDomain) else domain
+    already_registered = _APP_REGISTERED_CALLABLES.setdefault(app, set())
+    package_prefix = f"{package}." if package else None
+
+    for callable_fn, callable_annotations in registry.get(domain_str, ()):
+        if callable_fn in already_registered:
+            continue
 
-    filtered_callables = [
-        (func, ann) for func, ann in resource_list if ann.get("domain") == domain_str
-    ]
+        if package_prefix and not callable_fn.__module__.startswith(package_prefix):
+            continue
 
-    for callable_fn, callable_annotations in filtered_callables:
         register_fn(app, callable_fn, callable_annotations)
+        already_registered.add(callable_fn)
 
 
 def register_mcp_tools(
     app: FastMCP,
     domain: ToolDomain | str,
+    package: str | None = None,
 ) -> None:  # noqa: ANN401
     """Register tools with the FastMCP app, filtered by domain.
 
     Args:
         app: The FastMCP app instance
         domain: The domain to register for (e.g., ToolDomain.SESSION, "session")
+        package: If given, only register callables defined in this package
     """
 
     def _register_fn(
@@ -274,20 +298,23 @@ def register_mcp_tools(
     _register_mcp_callables(
         app=app,
         domain=domain,
-        resource_list=_REGISTERED_TOOLS,
+        registry=_REGISTERED_TOOLS,
         register_fn=_register_fn,
+        package=package,
     )
 
 
 def register_mcp_prompts(
     app: FastMCP,
     domain: ToolDomain | str,
+    package: str | None = None,
 ) -> None:  # noqa: ANN401
     """Register prompt callables with the FastMCP app, filtered by domain.
 
     Args:
         app: The FastMCP app instance
         domain: The domain to register for (e.g., ToolDomain.SESSION, "session")
+        package: If given, only register callables defined in this package
     """
 
     def _register_fn(
@@ -303,20 +330,23 @@ def register_mcp_prompts(
     _register_mcp_callables(
         app=app,
         domain=domain,
-        resource_list=_REGISTERED_PROMPTS,
+        registry=_REGISTERED_PROMPTS,
         register_fn=_register_fn,
+        package=package,
     )
 
 
 def register_mcp_resources(
     app: FastMCP,
     domain: ToolDomain | str,
+    package: str | None = None,
 ) -> None:  # noqa: ANN401
     """Register resource callables with the FastMCP app, filtered by domain.
 
     Args:
         app: The FastMCP app instance
         domain: The domain to register for (e.g., ToolDomain.SESSION, "session")
+        package: If given, only register callables defined in this package
     """
 
     def _register_fn(
@@ -334,6 +364,7 @@ def register_mcp_resources(
     _register_mcp_callables(
         app=app,
         domain=domain,
-        resource_list=_REGISTERED_RESOURCES,
+        registry=_REGISTERED_RESOURCES,
         register_fn=_register_fn,
+        package=package,
     )
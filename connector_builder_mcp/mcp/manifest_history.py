@@ -12,16 +12,19 @@ Revisions are identified by a triple: (ordinal, timestamp_ns, content_hash)
 Users can reference revisions by any component or combination thereof.
 """
 
-import json
 import logging
+import os
 import time
 from datetime import datetime, timezone
+from pathlib import Path
 from typing import Annotated
 
 from fastmcp import Context, FastMCP
 from pydantic import Field
 
 from connector_builder_mcp._manifest_history_utils import (
+    _LEGACY_REVISION_FILE_RE,
+    _REVISION_FILE_RE,
     AmbiguousHashError,
     CheckpointDetails,
     CheckpointType,
@@ -35,12 +38,17 @@ from connector_builder_mcp._manifest_history_utils import (
     ValidationCheckpointDetails,
     _compute_content_hash,
     _get_next_ordinal,
+    _get_revision_ids_by_ordinal,
     _load_revision_metadata,
+    _read_revision_content,
     _save_revision_metadata,
+    _write_revision_content,
+    _write_revision_metadata,
+    ensure_history_dir,
     get_history_dir,
 )
 from connector_builder_mcp._paths import get_session_manifest_path
-from connector_builder_mcp._text_utils import unified_diff_with_context
+from connector_builder_mcp._text_utils import NO_CHANGES_DIFF, unified_diff_with_context
 from connector_builder_mcp.mcp._mcp_utils import ToolDomain, mcp_tool, register_mcp_tools
 
 
@@ -66,22 +74,7 @@ def find_revision_by_ordinal(session_id: str, ordinal: int) -> RevisionId | None
     """
     manifest_path = get_session_manifest_path(session_id)
     history_dir = get_history_dir(manifest_path)
-    revision_files = list(history_dir.glob(f"{ordinal}_*.yaml"))
-
-    if not revision_files:
-        return None
-
-    # Get the most recent file if multiple exist (shouldn't happen)
-    revision_path = max(revision_files, key=lambda p: p.stat().st_mtime)
-
-    # Parse filename: {ordinal}_{timestamp_ns}_{hash}.yaml
-    parts = revision_path.stem.split("_")
-    if len(parts) >= 3:
-        timestamp_ns = int(parts[1])
-        content_hash = parts[2]
-        return (ordinal, timestamp_ns, content_hash)
-
-    return None
+    return _get_revision_ids_by_ordinal(history_dir).get(ordinal)
 
 
 def find_revision_by_hash_prefix(
@@ -179,6 +172,14 @@ def _get_latest_revision(session_id: str) -> RevisionId | None:
     Returns:
         Full RevisionId triple, or None if no revisions exist
     """
+    manifest_path = get_session_manifest_path(session_id)
+    history_dir = get_history_dir(manifest_path)
+    revision_ids = _get_revision_ids_by_ordinal(history_dir)
+    if revision_ids:
+        # New revisions always get ordinals above any legacy ones, so this is the latest
+        return revision_ids[max(revision_ids)]
+
+    # Legacy-only histories need their content hashed to build revision IDs
     revisions = _list_manifest_revisions(session_id)
 
     if len(revisions) == 0:
@@ -270,22 +271,24 @@ def _save_manifest_revision(
     """
     manifest_path = get_session_manifest_path(session_id)
     history_dir = get_history_dir(manifest_path)
+    ensure_history_dir(history_dir)
     ordinal = _get_next_ordinal(history_dir)
 
     # Get nanosecond-precision timestamp
     timestamp = time.time()
     timestamp_ns = int(timestamp * 1_000_000_000)
 
-    # Compute content hash (16 chars)
-    content_hash = _compute_content_hash(content, length=16)
-    file_size_bytes = len(content.encode("utf-8"))
+    # Encode once for the hash, the size, and the file write
+    content_bytes = content.encode("utf-8")
+    content_hash = _compute_content_hash(content_bytes, length=16)
+    file_size_bytes = len(content_bytes)
 
     # Create full revision ID
     revision_id: RevisionId = (ordinal, timestamp_ns, content_hash)
 
     # New filename format: {ordinal}_{timestamp_ns}_{hash}.yaml
     revision_path = history_dir / f"{ordinal}_{timestamp_ns}_{content_hash}.yaml"
-    revision_path.write_text(content, encoding="utf-8")
+    _write_revision_content(revision_path, content_bytes)
 
     _save_revision_metadata(
         history_dir=history_dir,
@@ -304,6 +307,30 @@ def _save_manifest_revision(
     return revision_id
 
 
+def _resolve_revision_path(
+    session_id: str,
+    revision: RevisionRef,
+) -> tuple[RevisionId, Path] | None:
+    """Resolve a revision reference to its ID and content file path.
+
+    Args:
+        session_id: Session ID
+        revision: Revision reference (ordinal, hash prefix, timestamp, or full tuple)
+
+    Returns:
+        Tuple of (revision_id, revision_path), or None if the reference cannot be resolved
+    """
+    try:
+        revision_id = _resolve_revision_ref(session_id, revision)
+    except (ValueError, AmbiguousHashError, TypeError):
+        return None
+
+    ordinal, timestamp_ns, content_hash = revision_id
+    manifest_path = get_session_manifest_path(session_id)
+    history_dir = get_history_dir(manifest_path)
+    return revision_id, history_dir / f"{ordinal}_{timestamp_ns}_{content_hash}.yaml"
+
+
 def _get_manifest_revision(
     session_id: Annotated[str, Field(description="Session ID")],
     revision: Annotated[
@@ -324,23 +351,18 @@ def _get_manifest_revision(
     Returns:
         Manifest revision with content and metadata, or None if not found
     """
-    try:
-        revision_id = _resolve_revision_ref(session_id, revision)
-    except (ValueError, AmbiguousHashError, TypeError):
+    resolved = _resolve_revision_path(session_id, revision)
+    if resolved is None:
         return None
 
+    revision_id, revision_path = resolved
     ordinal, timestamp_ns, content_hash = revision_id
-    manifest_path = get_session_manifest_path(session_id)
-    history_dir = get_history_dir(manifest_path)
-
-    # Look for file with this revision ID
-    revision_path = history_dir / f"{ordinal}_{timestamp_ns}_{content_hash}.yaml"
 
-    if not revision_path.exists():
+    try:
+        content = _read_revision_content(revision_path)
+    except FileNotFoundError:
         return None
 
-    content = revision_path.read_text(encoding="utf-8")
-
     # Load metadata
     metadata_path = revision_path.with_suffix(".meta.json")
     if metadata_path.exists():
@@ -357,12 +379,20 @@ def _get_manifest_revision(
             content_hash=content_hash,
             checkpoint_type=CheckpointType.NONE,
             checkpoint_details=None,
-            file_size_bytes=len(content.encode("utf-8")),
+            file_size_bytes=revision_path.stat().st_size,
         )
 
     return ManifestRevision(metadata=metadata, content=content)
 
 
+def _get_revision_timestamp_iso(revision_path: Path, timestamp_ns: int) -> str:
+    """Get a revision's ISO timestamp from its metadata, or from its filename if missing."""
+    try:
+        return _load_revision_metadata(revision_path.with_suffix(".meta.json")).timestamp_iso
+    except FileNotFoundError:
+        return datetime.fromtimestamp(timestamp_ns / 1_000_000_000, tz=timezone.utc).isoformat()
+
+
 def _list_manifest_revisions(
     session_id: Annotated[str, Field(description="Session ID")],
 ) -> list[ManifestRevisionSummary]:
@@ -376,20 +406,36 @@ def _list_manifest_revisions(
     """
     manifest_path = get_session_manifest_path(session_id)
     history_dir = get_history_dir(manifest_path)
-    revision_files = sorted(history_dir.glob("*.yaml"), key=lambda p: p.stem)
+
+    # Collect revision files and metadata sidecars in a single directory pass
+    revision_entries: list[os.DirEntry[str]] = []
+    metadata_entries: dict[RevisionId, os.DirEntry[str]] = {}
+    try:
+        entries = os.scandir(history_dir)
+    except FileNotFoundError:
+        return []
+    with entries:
+        for entry in entries:
+            match = _REVISION_FILE_RE.match(entry.name)
+            if match and match[4] == "meta.json":
+                metadata_entries[(int(match[1]), int(match[2]), match[3])] = entry
+            elif match or _LEGACY_REVISION_FILE_RE.match(entry.name):
+                revision_entries.append(entry)
+    revision_entries.sort(key=lambda e: e.name)
 
     revisions: list[ManifestRevisionSummary] = []
     seen_ordinals: set[int] = set()
 
-    for revision_path in revision_files:
+    for revision_entry in revision_entries:
         try:
-            parts = revision_path.stem.split("_")
+            match = _REVISION_FILE_RE.match(revision_entry.name)
+            legacy_match = _LEGACY_REVISION_FILE_RE.match(revision_entry.name)
 
             # New format: {ordinal}_{timestamp_ns}_{hash}.yaml
-            if len(parts) >= 3:
-                ordinal = int(parts[0])
-                timestamp_ns = int(parts[1])
-                content_hash = parts[2]
+            if match:
+                ordinal = int(match[1])
+                timestamp_ns = int(match[2])
+                content_hash = match[3]
 
                 if ordinal in seen_ordinals:
                     continue
@@ -397,14 +443,14 @@ def _list_manifest_revisions(
 
                 revision_id: RevisionId = (ordinal, timestamp_ns, content_hash)
 
-                metadata_path = revision_path.with_suffix(".meta.json")
-                if metadata_path.exists():
-                    metadata = _load_revision_metadata(metadata_path)
+                metadata_entry = metadata_entries.get(revision_id)
+                if metadata_entry is not None:
+                    metadata = _load_revision_metadata(metadata_entry.path)
                 else:
-                    # Create metadata from file
+                    # Create metadata from the file name and directory entry, without reading it.
+                    # Every field is derived locally, so per-field validation is skipped.
                     timestamp = timestamp_ns / 1_000_000_000
-                    content = revision_path.read_text(encoding="utf-8")
-                    metadata = ManifestRevisionMetadata(
+                    metadata = ManifestRevisionMetadata.model_construct(
                         revision_id=revision_id,
                         ordinal=ordinal,
                         timestamp_ns=timestamp_ns,
@@ -415,24 +461,24 @@ def _list_manifest_revisions(
                         content_hash=content_hash,
                         checkpoint_type=CheckpointType.NONE,
                         checkpoint_details=None,
-                        file_size_bytes=len(content.encode("utf-8")),
+                        file_size_bytes=revision_entry.stat().st_size,
                     )
 
             # Legacy format: v{ordinal}_{timestamp}.yaml
-            elif len(parts) >= 2 and parts[0].startswith("v"):
-                ordinal = int(parts[0][1:])
-                timestamp = float(parts[1])
+            elif legacy_match:
+                ordinal = int(legacy_match[1])
+                timestamp = float(legacy_match[2])
                 timestamp_ns = int(timestamp * 1_000_000_000)
 
                 if ordinal in seen_ordinals:
                     continue
                 seen_ordinals.add(ordinal)
 
-                content = revision_path.read_text(encoding="utf-8")
+                content = _read_revision_content(revision_entry.path)
                 content_hash = _compute_content_hash(content, length=16)
                 revision_id = (ordinal, timestamp_ns, content_hash)
 
-                metadata = ManifestRevisionMetadata(
+                metadata = ManifestRevisionMetadata.model_construct(
                     revision_id=revision_id,
                     ordinal=ordinal,
                     timestamp_ns=timestamp_ns,
@@ -441,7 +487,7 @@ def _list_manifest_revisions(
                     content_hash=content_hash,
                     checkpoint_type=CheckpointType.NONE,
                     checkpoint_details=None,
-                    file_size_bytes=len(content.encode("utf-8")),
+                    file_size_bytes=revision_entry.stat().st_size,
                 )
             else:
                 continue
@@ -458,7 +504,7 @@ def _list_manifest_revisions(
                             f" ({metadata.checkpoint_details.streams_tested} streams)"
                         )
 
-            summary = ManifestRevisionSummary(
+            summary = ManifestRevisionSummary.model_construct(
                 revision_id=metadata.revision_id,
                 ordinal=metadata.ordinal,
                 timestamp_iso=metadata.timestamp_iso,
@@ -470,7 +516,7 @@ def _list_manifest_revisions(
             revisions.append(summary)
 
         except (ValueError, IndexError) as e:
-            logger.warning(f"Failed to parse revision file {revision_path}: {e}")
+            logger.warning(f"Failed to parse revision file {revision_entry.path}: {e}")
             continue
 
     revisions.sort(key=lambda r: r.ordinal)
@@ -509,24 +555,42 @@ def _diff_manifest_revisions(
     Returns:
         Diff result with full RevisionId tuples, or None if either revision not found
     """
-    from_manifest = _get_manifest_revision(session_id, from_revision)
-    to_manifest = _get_manifest_revision(session_id, to_revision)
+    from_result = _resolve_revision_path(session_id, from_revision)
+    to_result = _resolve_revision_path(session_id, to_revision)
 
-    if from_manifest is None or to_manifest is None:
+    if from_result is None or to_result is None:
         return None
 
-    diff = unified_diff_with_context(
-        from_manifest.content,
-        to_manifest.content,
-        context=context_lines,
-    )
+    from_revision_id, from_path = from_result
+    to_revision_id, to_path = to_result
+
+    if from_revision_id[2] == to_revision_id[2]:
+        # Same content hash means same content, so skip reading and diffing it
+        if not (from_path.is_file() and to_path.is_file()):
+            return None
+        diff = NO_CHANGES_DIFF
+    else:
+        try:
+            from_content = _read_revision_content(from_path)
+            to_content = _read_revision_content(to_path)
+        except FileNotFoundError:
+            return None
+
+        diff = unified_diff_with_context(
+            from_content,
+            to_content,
+            context=context_lines,
+        )
+
+    from_timestamp_iso = _get_revision_timestamp_iso(from_path, from_revision_id[1])
+    to_timestamp_iso = _get_revision_timestamp_iso(to_path, to_revision_id[1])
 
     return ManifestRevisionDiff(
-        from_revision=from_manifest.metadata.revision_id,
-        to_revision=to_manifest.metadata.revision_id,
+        from_revision=from_revision_id,
+        to_revision=to_revision_id,
         diff=diff,
-        from_timestamp_iso=from_manifest.metadata.timestamp_iso,
-        to_timestamp_iso=to_manifest.metadata.timestamp_iso,
+        from_timestamp_iso=from_timestamp_iso,
+        to_timestamp_iso=to_timestamp_iso,
     )
 
 
@@ -546,14 +610,13 @@ def _checkpoint_manifest_revision(
     Returns:
         Full RevisionId triple of the checkpointed revision, or None if no revisions exist
     """
-    history = _list_manifest_revisions(session_id)
+    latest_revision_id = _get_latest_revision(session_id)
 
-    if len(history) == 0:
+    if latest_revision_id is None:
         logger.warning(f"No revisions exist for session {session_id[:8]}... - cannot checkpoint")
         return None
 
-    latest_revision = history[-1]
-    ordinal, timestamp_ns, content_hash = latest_revision.revision_id
+    ordinal, timestamp_ns, content_hash = latest_revision_id
 
     manifest_path = get_session_manifest_path(session_id)
     history_dir = get_history_dir(manifest_path)
@@ -562,20 +625,20 @@ def _checkpoint_manifest_revision(
     metadata_path = history_dir / f"{ordinal}_{timestamp_ns}_{content_hash}.meta.json"
 
     if metadata_path.exists():
-        metadata = _load_revision_metadata(metadata_path)
-        metadata.checkpoint_type = checkpoint_type
-        metadata.checkpoint_details = checkpoint_details
-
-        metadata_path.write_text(
-            json.dumps(metadata.model_dump(mode="json"), indent=2), encoding="utf-8"
+        metadata = _load_revision_metadata(metadata_path).model_copy(
+            update={
+                "checkpoint_type": checkpoint_type,
+                "checkpoint_details": checkpoint_details,
+            }
         )
+        _write_revision_metadata(metadata_path, metadata)
 
         logger.info(
             f"Updated checkpoint for revision {ordinal} ({content_hash[:8]}) "
             f"to {checkpoint_type.value}"
         )
 
-    return latest_revision.revision_id
+    return latest_revision_id
 
 
 @mcp_tool(
@@ -0,0 +1,53 @@
+"""Hatch build hook that ships precompiled checklist JSON sidecars in the wheel.
+
+Each build strategy's `checklist.yaml` is converted to a `checklist.json` sidecar,
+which `BuildStrategy.load_checklist_yaml()` reads instead of parsing YAML on cold
+start. The sidecars are generated into a temporary directory and force-included,
+so building never writes into the source tree.
+
+The package itself is not imported here, since its runtime dependencies are not
+installed in the isolated build environment. Run
+`python -m connector_builder_mcp.build_strategies.precompile_checklists` to
+generate the sidecars in a development checkout instead.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any
+
+import yaml
+from hatchling.builders.hooks.plugin.interface import BuildHookInterface
+
+
+STRATEGIES_DIR = Path("connector_builder_mcp") / "build_strategies"
+
+_SAFE_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class CustomBuildHook(BuildHookInterface):
+    """Generate checklist JSON sidecars and add them to the wheel."""
+
+    def initialize(self, version: str, build_data: dict[str, Any]) -> None:
+        """Write a JSON sidecar for every strategy checklist and force-include it."""
+        if version == "editable":
+            return
+
+        self._output_dir = Path(tempfile.mkdtemp(prefix="checklists-"))
+        for yaml_path in sorted((Path(self.root) / STRATEGIES_DIR).glob("*/checklist.yaml")):
+            data = yaml.load(yaml_path.read_bytes(), Loader=_SAFE_LOADER)
+            json_path = self._output_dir / yaml_path.parent.name / "checklist.json"
+            json_path.parent.mkdir()
+            json_path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+            build_data["force_include"][str(json_path)] = (
+                STRATEGIES_DIR / yaml_path.parent.name / "checklist.json"
+            ).as_posix()
+
+    def finalize(self, version: str, build_data: dict[str, Any], artifact_path: str) -> None:
+        """Remove the temporary sidecar directory."""
+        output_dir = getattr(self, "_output_dir", None)
+        if output_dir is not None:
+            shutil.rmtree(output_dir, ignore_errors=True)
@@ -0,0 +1,198 @@
+"""Tests for build strategy registration utilities."""
+
+import asyncio
+import importlib
+import subprocess
+from unittest.mock import patch
+
+import pytest
+import yaml
+from fastmcp import FastMCP
+
+from connector_builder_mcp.build_strategies.base.java_runtime import is_java_21_available
+from connector_builder_mcp.build_strategies.declarative_openapi_v3.build_strategy import (
+    DeclarativeOpenApiV3Strategy,
+)
+from connector_builder_mcp.build_strategies.declarative_yaml_v1.build_strategy import (
+    DeclarativeYamlV1Strategy,
+)
+from connector_builder_mcp.build_strategies.kotlin_destination.build_strategy import (
+    KotlinDestinationStrategy,
+)
+from connector_builder_mcp.build_strategies.kotlin_source.build_strategy import (
+    KotlinSourceStrategy,
+)
+
+
+class TestLoadChecklistYaml:
+    """Test checklist YAML loading and caching."""
+
+    @pytest.fixture
+    def strategy_dir(self, monkeypatch, tmp_path):
+        """Serve the YAML strategy's checklist from a temporary copy of its directory."""
+        yaml_resource = DeclarativeYamlV1Strategy._get_strategy_resource("checklist.yaml")
+        (tmp_path / "checklist.yaml").write_bytes(yaml_resource.read_bytes())
+        monkeypatch.setattr(
+            DeclarativeYamlV1Strategy,
+            "_get_strategy_resource",
+            classmethod(lambda cls, filename: tmp_path / filename),
+        )
+        return tmp_path
+
+    def test_load_checklist_yaml(self):
+        """Test that the checklist YAML is loaded as a dictionary."""
+        data = DeclarativeYamlV1Strategy.load_checklist_yaml()
+
+        assert isinstance(data, dict)
+        assert "basic_connector_tasks" in data
+
+    def test_repeated_loads_are_cached(self):
+        """Test that repeated loads do not re-parse the YAML file."""
+        DeclarativeYamlV1Strategy.load_checklist_yaml()
+
+        with patch.object(yaml, "load", side_effect=AssertionError("re-parsed")):
+            data = DeclarativeYamlV1Strategy.load_checklist_yaml()
+
+        assert "basic_connector_tasks" in data
+
+    def test_cached_result_is_not_shared(self):
+        """Test that mutating a returned checklist does not affect later loads."""
+        data = DeclarativeYamlV1Strategy.load_checklist_yaml()
+        data["basic_connector_tasks"].clear()
+
+        fresh = DeclarativeYamlV1Strategy.load_checklist_yaml()
+
+        assert fresh["basic_connector_tasks"]
+
+    def test_json_sidecar_is_preferred(self, strategy_dir):
+        """Test that an up-to-date JSON sidecar is used instead of parsing YAML."""
+        json_path = DeclarativeYamlV1Strategy.write_checklist_json_cache()
+
+        with patch.object(yaml, "load", side_effect=AssertionError("parsed YAML")):
+            data = DeclarativeYamlV1Strategy.load_checklist_yaml()
+
+        assert json_path == strategy_dir / "checklist.json"
+        assert "basic_connector_tasks" in data
+
+    def test_load_does_not_write_json_sidecar(self, strategy_dir):
+        """Test that loading a checklist never writes into the strategy package."""
+
+        DeclarativeYamlV1Strategy.load_checklist_yaml()
+
+        assert not (strategy_dir / "checklist.json").exists()
+
+
+class TestRegistrationSteps:
+    """Test the precomputed strategy registration steps."""
+
+    def test_steps_are_bound_to_subclass_in_order(self):
+        """Test that each subclass captures its own registration methods in order."""
+        steps = DeclarativeYamlV1Strategy._registration_steps
+
+        assert [step.__name__ for step in steps] == [
+            "register_guidance_tools",
+            "register_validation_tools",
+            "register_testing_tools",
+            "register_prompts",
+        ]
+        assert all(step.__self__ is DeclarativeYamlV1Strategy for step in steps)
+
+
+class TestStrategyIsolation:
+    """Test that each strategy registers only its own tools and prompts."""
+
+    def test_strategy_does_not_register_imported_strategy_tools(self):
+        """Test that tools of another, already imported strategy are not registered."""
+        importlib.import_module(
+            "connector_builder_mcp.build_strategies.declarative_openapi_v3.guidance"
+        )
+        importlib.import_module("connector_builder_mcp.build_strategies.kotlin_source.guidance")
+
+        app = FastMCP("test")
+        DeclarativeYamlV1Strategy.register_all_mcp_callables(app)
+        tool_names = asyncio.run(app.get_tools()).keys()
+
+        assert "get_connector_builder_docs" in tool_names
+        assert "get_kotlin_source_connector_docs" not in tool_names
+        assert "get_openapi_connector_docs" not in tool_names
+
+    def test_openapi_strategy_registers_its_tools(self):
+        """Test that the OpenAPI strategy registers its own tools and prompt."""
+        app = FastMCP("test")
+        DeclarativeOpenApiV3Strategy.register_all_mcp_callables(app)
+
+        assert set(asyncio.run(app.get_tools())) == {
+            "get_openapi_connector_docs",
+            "validate_openapi_spec",
+            "test_openapi_resource",
+        }
+        assert set(asyncio.run(app.get_prompts())) == {"new_openapi_connector"}
+
+
+class TestKotlinAvailability:
+    """Test the cached Java 21 availability probe."""
+
+    @pytest.fixture(autouse=True)
+    def _clear_cache(self):
+        is_java_21_available.cache_clear()
+        yield
+        is_java_21_available.cache_clear()
+
+    def test_java_version_env_skips_probe(self, monkeypatch):
+        """Test that JAVA_VERSION=21 short-circuits the subprocess probe."""
+        monkeypatch.setenv("JAVA_VERSION", "jdk-21.0.2+13")
+
+        with patch("subprocess.run", side_effect=AssertionError("probed")):
+            assert KotlinDestinationStrategy.is_available() is True
+
+    def test_probe_result_is_cached(self, monkeypatch):
+        """Test that the java probe runs at most once."""
+        monkeypatch.delenv("JAVA_VERSION", raising=False)
+
+        with patch("shutil.which", return_value=None) as which:
+            assert KotlinDestinationStrategy.is_available() is False
+            assert KotlinDestinationStrategy.is_available() is False
+
+        which.assert_called_once()
+
+    def test_probe_is_shared_between_strategies(self, monkeypatch):
+        """Test that both Kotlin strategies use the same cached java probe."""
+        monkeypatch.delenv("JAVA_VERSION", raising=False)
+
+        with patch("shutil.which", return_value=None) as which:
+            assert KotlinSourceStrategy.is_available() is False
+            assert KotlinDestinationStrategy.is_available() is False
+
+        which.assert_called_once()
+
+    def test_skip_java_probe_env(self, monkeypatch):
+        """Test that CONNECTOR_BUILDER_SKIP_JAVA_PROBE disables the java probe."""
+        monkeypatch.delenv("JAVA_VERSION", raising=False)
+        monkeypatch.setenv("CONNECTOR_BUILDER_SKIP_JAVA_PROBE", "1")
+
+        with patch("shutil.which", side_effect=AssertionError("probed")):
+            assert KotlinDestinationStrategy.is_available() is False
+
+    @pytest.mark.parametrize(
+        "version_output,expected",
+        [
+            (b'openjdk version "21.0.2" 2024-01-16\n', True),
+            (b'java version "21" 2023-09-19 LTS\n', True),
+            (
+                b'java version "1.8.0_321"\nJava(TM) SE Runtime Environment (build 1.8.0_321-b07)\n',
+                False,
+            ),
+            (b'openjdk version "17.0.10" 2024-01-16\n', False),
+        ],
+    )
+    def test_java_version_output_parsing(self, monkeypatch, version_output, expected):
+        """Test that only a Java 21 version line counts as available."""
+        monkeypatch.delenv("JAVA_VERSION", raising=False)
+        monkeypatch.delenv("CONNECTOR_BUILDER_SKIP_JAVA_PROBE", raising=False)
+        completed = subprocess.CompletedProcess(["java", "-version"], 0, b"", version_output)
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/java"),
+            patch("subprocess.run", return_value=completed),
+        ):
+            assert KotlinDestinationStrategy.is_available() is expected
@@ -0,0 +1,212 @@
+"""Tests for the declarative YAML v1 guidance tools."""
+
+import json
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from connector_builder_mcp.build_strategies.declarative_yaml_v1 import guidance
+
+
+REGISTRY_DATA = {
+    "sources": [
+        {"dockerRepository": "airbyte/source-faker", "language": "python"},
+        {"dockerRepository": "airbyte/source-rick", "language": "manifest-only"},
+    ],
+    "destinations": [
+        {"dockerRepository": "airbyte/destination-dev-null", "tags": ["language:manifest-only"]},
+    ],
+}
+
+
+def _registry_response(status_code=200, etag='"v1"'):
+    response = MagicMock()
+    response.status_code = status_code
+    response.content = json.dumps(REGISTRY_DATA).encode()
+    response.headers = {"ETag": etag}
+    return response
+
+
+@pytest.fixture(autouse=True)
+def reset_registry_cache(monkeypatch, tmp_path):
+    """Start each test with empty in-memory and on-disk registry caches."""
+    monkeypatch.setattr(guidance, "_registry_snapshot", None)
+    monkeypatch.setattr(guidance, "_registry_failed_at", None)
+    monkeypatch.setattr(guidance, "_registry_refresh", None)
+    monkeypatch.setattr(
+        guidance, "_get_registry_cache_path", lambda: tmp_path / "registry_cache.json"
+    )
+
+
+class TestRegistryCache:
+    """Test the in-memory registry cache."""
+
+    def test_registry_is_fetched_once_within_ttl(self):
+        """Test that repeated lookups reuse the cached registry."""
+        with patch.object(
+            guidance._HTTP_SESSION, "get", return_value=_registry_response()
+        ) as mock_get:
+            assert guidance._is_manifest_only_connector("source-rick") is True
+            assert guidance._is_manifest_only_connector("source-faker") is False
+
+        mock_get.assert_called_once()
+
+    def test_manifest_only_lookup(self):
+        """Test manifest-only detection by language, by tag, and for unknown connectors."""
+        with patch.object(guidance._HTTP_SESSION, "get", return_value=_registry_response()):
+            assert guidance._is_manifest_only_connector("destination-dev-null") is True
+            assert guidance._is_manifest_only_connector("source-unknown") is False
+
+    def test_expired_registry_is_revalidated(self):
+        """Test that an expired registry is revalidated with its ETag."""
+        with patch.object(
+            guidance._HTTP_SESSION,
+            "get",
+            side_effect=[_registry_response(), _registry_response(status_code=304)],
+        ) as mock_get:
+            with patch("time.monotonic", return_value=0.0):
+                guidance._get_registry_index()
+            with patch("time.monotonic", return_value=guidance._REGISTRY_TTL_SECONDS + 1.0):
+                assert "source-faker" in guidance._get_registry_index()
+
+        assert mock_get.call_count == 2
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_failed_download_is_not_retried_during_backoff(self):
+        """Test that a failed registry download is cached briefly instead of retried per call."""
+        with patch.object(
+            guidance._HTTP_SESSION, "get", side_effect=requests.ConnectionError("offline")
+        ) as mock_get:
+            with pytest.raises(requests.ConnectionError):
+                guidance._is_manifest_only_connector("source-rick")
+            with pytest.raises(RuntimeError, match="retrying later"):
+                guidance._is_manifest_only_connector("source-rick")
+            result = guidance.get_connector_manifest("source-rick")
+
+        mock_get.assert_called_once()
+        assert result.startswith("ERROR: The connector registry is unavailable")
+        assert "Please retry later." in result
+        assert "not manifest-only" not in result
+
+    def test_concurrent_lookups_share_one_download(self):
+        """Test that lookups made while the registry downloads wait for that download."""
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get(url, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return _registry_response()
+
+        with patch.object(guidance._HTTP_SESSION, "get", side_effect=slow_get) as mock_get:
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = [executor.submit(guidance._get_registry_index) for _ in range(4)]
+                assert started.wait(timeout=5)
+                release.set()
+                results = [future.result(timeout=5) for future in futures]
+
+        mock_get.assert_called_once()
+        assert all(result["source-rick"] for result in results)
+
+    def test_expired_registry_is_served_while_refreshing(self):
+        """Test that a lookup during a refresh gets the expired index instead of blocking."""
+        with patch.object(guidance._HTTP_SESSION, "get", return_value=_registry_response()):
+            with patch("time.monotonic", return_value=0.0):
+                guidance._get_registry_index()
+
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow_get(url, **kwargs):
+            started.set()
+            release.wait(timeout=5)
+            return _registry_response(status_code=304)
+
+        expired = guidance._REGISTRY_TTL_SECONDS + 1.0
+        with (
+            patch.object(guidance._HTTP_SESSION, "get", side_effect=slow_get) as mock_get,
+            patch("time.monotonic", return_value=expired),
+            ThreadPoolExecutor(max_workers=1) as executor,
+        ):
+            refresh = executor.submit(guidance._get_registry_index)
+            assert started.wait(timeout=5)
+            assert guidance._is_manifest_only_connector("source-rick") is True
+            release.set()
+            refresh.result(timeout=5)
+
+        mock_get.assert_called_once()
+
+    def test_registry_is_revalidated_from_disk_cache(self, monkeypatch):
+        """Test that a new process revalidates the persisted registry instead of re-downloading."""
+        with patch.object(guidance._HTTP_SESSION, "get", return_value=_registry_response()):
+            guidance._get_registry_index()
+
+        monkeypatch.setattr(guidance, "_registry_snapshot", None)
+        with patch.object(
+            guidance._HTTP_SESSION, "get", return_value=_registry_response(status_code=304)
+        ) as mock_get:
+            assert guidance._is_manifest_only_connector("source-rick") is True
+
+        assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+    def test_corrupt_disk_cache_is_ignored(self):
+        """Test that an unreadable disk cache falls back to a full download."""
+        guidance._get_registry_cache_path().write_text("not json")
+
+        with patch.object(
+            guidance._HTTP_SESSION, "get", return_value=_registry_response()
+        ) as mock_get:
+            assert guidance._is_manifest_only_connector("source-rick") is True
+
+        assert mock_get.call_args.kwargs["headers"] == {}
+
+
+class TestGetConnectorManifest:
+    """Test fetching existing connector manifests."""
+
+    @staticmethod
+    def _fake_get(url, **kwargs):
+        if url == guidance._REGISTRY_URL:
+            return _registry_response()
+        response = MagicMock()
+        response.text = f"manifest from {url}"
+        return response
+
+    def test_manifest_only_connector(self):
+        """Test that the manifest is returned for a manifest-only connector."""
+        with patch.object(guidance._HTTP_SESSION, "get", side_effect=self._fake_get) as mock_get:
+            manifest = guidance.get_connector_manifest("source-rick", version="v1.2.3")
+
+        assert manifest.endswith("/source-rick/1.2.3/manifest.yaml")
+        assert mock_get.call_count == 2
+
+    def test_not_manifest_only_connector_skips_manifest_request(self):
+        """Test that no manifest request is made for a connector that is not manifest-only."""
+        with patch.object(guidance._HTTP_SESSION, "get", side_effect=self._fake_get) as mock_get:
+            result = guidance.get_connector_manifest("source-faker")
+
+        assert result == "ERROR: This connector is not manifest-only."
+        assert [call.args[0] for call in mock_get.call_args_list] == [guidance._REGISTRY_URL]
+
+    def test_cached_registry_makes_no_requests(self):
+        """Test that a non-manifest-only connector costs no requests once the registry is cached."""
+        with patch.object(guidance._HTTP_SESSION, "get", side_effect=self._fake_get):
+            guidance._get_registry_index()
+
+        with patch.object(guidance._HTTP_SESSION, "get", side_effect=self._fake_get) as mock_get:
+            result = guidance.get_connector_manifest("source-faker")
+
+        assert result == "ERROR: This connector is not manifest-only."
+        mock_get.assert_not_called()
+
+
+def test_http_session_enables_tcp_keepalive():
+    """Test that pooled connections are opened with TCP keepalive enabled."""
+    adapter = guidance._HTTP_SESSION.get_adapter(guidance._REGISTRY_URL)
+    socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
@@ -0,0 +1,105 @@
+"""Tests for the Kotlin destination build strategy tools."""
+
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from connector_builder_mcp.build_strategies.kotlin_destination import (
+    guidance,
+    manifest_checks,
+    manifest_tests,
+)
+
+
+class TestKotlinDestinationWrite:
+    """Test the Kotlin destination write test tool."""
+
+    @pytest.mark.parametrize(
+        "kwargs,message",
+        [
+            ({}, "No project path provided"),
+            ({"project_path": "/tmp/project"}, "No configuration provided"),
+            (
+                {"project_path": "/tmp/project", "config": {}, "test_records": []},
+                "No test records provided",
+            ),
+        ],
+    )
+    def test_missing_arguments(self, ctx, kwargs, message):
+        """Test the error results for missing arguments."""
+        result = manifest_tests.test_kotlin_destination_write(ctx, stream_name="users", **kwargs)
+
+        assert result.success is False
+        assert result.message == message
+        assert result.errors
+
+    def test_success(self, ctx):
+        """Test the placeholder success result."""
+        result = manifest_tests.test_kotlin_destination_write(
+            ctx,
+            stream_name="users",
+            project_path="/tmp/project",
+            config={},
+            test_records=[{"id": 1}],
+        )
+
+        assert result.success is True
+        assert "users" in result.message
+
+    def test_repeated_write_tests_are_not_cached(self, ctx):
+        """Test that every call runs the write test instead of returning a cached result."""
+        kwargs = {"project_path": "/tmp/project", "config": {}, "test_records": [{"id": 1}]}
+
+        with patch.object(manifest_tests.logger, "info") as log_info:
+            manifest_tests.test_kotlin_destination_write(ctx, stream_name="users", **kwargs)
+            manifest_tests.test_kotlin_destination_write(ctx, stream_name="users", **kwargs)
+
+        assert log_info.call_count == 2
+
+    def test_error_result_is_frozen(self, ctx):
+        """Test that shared error results cannot be modified."""
+        result = manifest_tests.test_kotlin_destination_write(ctx, stream_name="users")
+
+        with pytest.raises(ValidationError):
+            result.success = True
+
+
+class TestValidateKotlinDestinationConnector:
+    """Test the Kotlin destination validation tool."""
+
+    def test_missing_project_path(self, ctx):
+        """Test the error result when no project path is given."""
+        result = manifest_checks.validate_kotlin_destination_connector(ctx)
+
+        assert result.model_dump() == {
+            "is_valid": False,
+            "errors": ("No project path provided",),
+            "warnings": (),
+            "streams_found": (),
+        }
+
+    def test_placeholder_validation(self, ctx):
+        """Test the placeholder validation result."""
+        result = manifest_checks.validate_kotlin_destination_connector(
+            ctx, project_path="/tmp/project"
+        )
+
+        assert result.is_valid is True
+        assert result.warnings
+
+
+class TestGetKotlinDestinationConnectorDocs:
+    """Test Kotlin destination connector documentation lookup."""
+
+    def test_unknown_topic_lists_available_topics(self):
+        """Test that an unknown topic reports every available topic."""
+        result = guidance.get_kotlin_destination_connector_docs("nope")
+
+        assert "Topic 'nope' not found" in result
+        assert all(topic in result for topic in guidance._TOPIC_DOCS)
+
+    def test_result_rejects_extra_fields(self):
+        """Test that result models reject unknown fields."""
+        with pytest.raises(ValidationError):
+            manifest_checks.KotlinDestinationValidationResult(is_valid=True, unknown=1)
@@ -1,13 +1,24 @@
 """Tests for manifest history tracking functionality."""
 
+import shutil
+from unittest.mock import patch
+from uuid import uuid4
+
 import pytest
+from pydantic import ValidationError
 
 from connector_builder_mcp._manifest_history_utils import (
     CheckpointType,
+    ManifestRevisionMetadata,
     ReadinessCheckpointDetails,
     RestoreCheckpointDetails,
     ValidationCheckpointDetails,
+    _compute_content_hash,
+    _PathCache,
+    get_history_dir,
 )
+from connector_builder_mcp._paths import get_session_manifest_path
+from connector_builder_mcp.mcp import manifest_history
 from connector_builder_mcp.mcp.manifest_edits import (
     get_session_manifest_content,
     set_session_manifest_text,
@@ -212,3 +223,195 @@ def test_mcp_tools_smoke(ctx):
     result = restore_session_manifest_version(ctx, version_number=1)
     assert "Successfully restored" in result
     assert "revision 3" in result
+
+
+def test_list_versions_without_metadata_sidecars(ctx):
+    """Test listing revisions whose metadata is missing or that use the legacy filename format."""
+    session_id = ctx.session_id
+    history_dir = get_history_dir(get_session_manifest_path(session_id))
+
+    (history_dir / "v1_1700000000.5.yaml").write_text(VALID_MINIMAL_MANIFEST_V1, encoding="utf-8")
+    _, timestamp_ns, content_hash = _save_manifest_revision(
+        session_id=session_id, content=VALID_MINIMAL_MANIFEST_V2
+    )
+    (history_dir / f"2_{timestamp_ns}_{content_hash}.meta.json").unlink()
+    (history_dir / "notes.txt").write_text("not a revision", encoding="utf-8")
+
+    history = _list_manifest_revisions(session_id)
+
+    assert [r.ordinal for r in history] == [1, 2]
+    assert history[0].revision_id == (
+        1,
+        1_700_000_000_500_000_000,
+        _compute_content_hash(VALID_MINIMAL_MANIFEST_V1),
+    )
+    assert history[0].file_size_bytes == len(VALID_MINIMAL_MANIFEST_V1.encode("utf-8"))
+    assert history[1].revision_id == (2, timestamp_ns, content_hash)
+    assert history[1].checkpoint_type == CheckpointType.NONE
+    assert history[1].file_size_bytes == len(VALID_MINIMAL_MANIFEST_V2.encode("utf-8"))
+
+
+def test_repeated_checkpoints_are_not_served_stale(ctx):
+    """Test that cached metadata reflects every checkpoint, even rewrites of the same size."""
+    session_id = ctx.session_id
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V1)
+
+    for checkpoint_type in (
+        CheckpointType.TEST_PASS,
+        CheckpointType.TEST_FAIL,
+        CheckpointType.TEST_PASS,
+    ):
+        _checkpoint_manifest_revision(session_id=session_id, checkpoint_type=checkpoint_type)
+
+        assert _list_manifest_revisions(session_id)[-1].checkpoint_type == checkpoint_type
+        revision = _get_manifest_revision(session_id, 1)
+        assert revision is not None
+        assert revision.metadata.checkpoint_type == checkpoint_type
+
+
+def test_save_non_ascii_manifest(ctx):
+    """Test that size and hash are computed from the UTF-8 encoded content."""
+    session_id = ctx.session_id
+    content = VALID_MINIMAL_MANIFEST_V1.replace("users", "utilisateurs-é")
+
+    _, _, content_hash = _save_manifest_revision(session_id=session_id, content=content)
+
+    revision = _get_manifest_revision(session_id, 1)
+    assert revision is not None
+    assert revision.content == content
+    assert content_hash == _compute_content_hash(content)
+    assert revision.metadata.file_size_bytes == len(content.encode("utf-8"))
+
+
+def test_checkpoint_does_not_list_history(ctx):
+    """Test that checkpointing resolves the latest revision without listing all revisions."""
+    session_id = ctx.session_id
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V1)
+    latest_revision_id = _save_manifest_revision(
+        session_id=session_id, content=VALID_MINIMAL_MANIFEST_V2
+    )
+
+    with patch.object(manifest_history, "_list_manifest_revisions") as list_revisions:
+        checkpoint_revision_id = _checkpoint_manifest_revision(
+            session_id=session_id, checkpoint_type=CheckpointType.TEST_PASS
+        )
+
+    list_revisions.assert_not_called()
+    assert checkpoint_revision_id == latest_revision_id
+
+
+def test_latest_revision_in_legacy_only_history(ctx):
+    """Test that 'latest' still resolves when only legacy revision files exist."""
+    session_id = ctx.session_id
+    history_dir = get_history_dir(get_session_manifest_path(session_id))
+    (history_dir / "v1_1700000000.yaml").write_text(VALID_MINIMAL_MANIFEST_V1, encoding="utf-8")
+
+    assert _checkpoint_manifest_revision(session_id, CheckpointType.TEST_PASS) == (
+        1,
+        1_700_000_000_000_000_000,
+        _compute_content_hash(VALID_MINIMAL_MANIFEST_V1),
+    )
+
+
+def test_diff_versions_timestamps(ctx):
+    """Test that diff timestamps come from metadata, or from the revision ID without it."""
+    session_id = ctx.session_id
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V1)
+    _, timestamp_ns, content_hash = _save_manifest_revision(
+        session_id=session_id, content=VALID_MINIMAL_MANIFEST_V2
+    )
+    from_revision = _get_manifest_revision(session_id, 1)
+    assert from_revision is not None
+    history_dir = get_history_dir(get_session_manifest_path(session_id))
+    (history_dir / f"2_{timestamp_ns}_{content_hash}.meta.json").unlink()
+
+    diff_result = _diff_manifest_revisions(session_id, 1, 2)
+
+    assert diff_result is not None
+    assert diff_result.from_timestamp_iso == from_revision.metadata.timestamp_iso
+    assert diff_result.to_timestamp_iso.startswith("20")
+    assert diff_result.to_revision == (2, timestamp_ns, content_hash)
+
+
+def test_diff_identical_revisions_skips_content(ctx):
+    """Test that revisions with the same content hash are not read or diffed."""
+    session_id = ctx.session_id
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V1)
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V2)
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V1)
+
+    with patch.object(manifest_history, "_read_revision_content") as read_content:
+        diff_result = _diff_manifest_revisions(session_id, 1, 3)
+
+    read_content.assert_not_called()
+    assert diff_result is not None
+    assert diff_result.diff == "[no changes]"
+    assert diff_result.from_revision[0] == 1
+    assert diff_result.to_revision[0] == 3
+
+
+def test_cached_revision_metadata_is_frozen(ctx):
+    """Test that memoized revision metadata cannot be mutated by one of its callers."""
+    session_id = ctx.session_id
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V1)
+
+    revision = _get_manifest_revision(session_id, 1)
+    assert revision is not None
+    with pytest.raises(ValidationError):
+        revision.metadata.checkpoint_type = CheckpointType.TEST_PASS
+
+    assert _list_manifest_revisions(session_id)[0].checkpoint_type == CheckpointType.NONE
+
+
+def test_save_in_other_session_keeps_listing_cached(ctx):
+    """Test that saving or checkpointing one session does not evict another session's cache."""
+    session_id = ctx.session_id
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V1)
+    _checkpoint_manifest_revision(session_id=session_id, checkpoint_type=CheckpointType.TEST_PASS)
+    _list_manifest_revisions(session_id)
+
+    other_session_id = str(uuid4())
+    _save_manifest_revision(session_id=other_session_id, content=VALID_MINIMAL_MANIFEST_V2)
+    _checkpoint_manifest_revision(
+        session_id=other_session_id, checkpoint_type=CheckpointType.TEST_FAIL
+    )
+
+    with patch.object(
+        ManifestRevisionMetadata, "model_validate_json", side_effect=AssertionError("re-parsed")
+    ):
+        revisions = _list_manifest_revisions(session_id)
+
+    assert revisions[0].checkpoint_type == CheckpointType.TEST_PASS
+
+
+def test_save_after_history_dir_removed(ctx):
+    """Test that saving recreates a history directory removed after it was first resolved."""
+    session_id = ctx.session_id
+    _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V1)
+    shutil.rmtree(get_history_dir(get_session_manifest_path(session_id)))
+
+    assert _list_manifest_revisions(session_id) == []
+
+    revision_id = _save_manifest_revision(session_id=session_id, content=VALID_MINIMAL_MANIFEST_V2)
+
+    assert revision_id[0] == 1
+    assert [r.revision_id for r in _list_manifest_revisions(session_id)] == [revision_id]
+
+
+def test_path_cache_is_bounded_and_invalidated_per_path():
+    """Test that the path cache evicts least recently used entries and drops written paths."""
+    loads = []
+
+    def load(path):
+        loads.append(path)
+        return path.upper()
+
+    cache = _PathCache(maxsize=2)
+    for path in ("a", "b", "c"):
+        cache.get(path, (1,), load)
+    assert cache.get("b", (1,), load) == "B"
+    cache.get("a", (1,), load)
+    cache.invalidate("b")
+    cache.get("b", (1,), load)
+
+    assert loads == ["a", "b", "c", "a", "b"]
@@ -0,0 +1,43 @@
+"""Tests for deferred MCP registration utilities."""
+
+import asyncio
+from unittest.mock import patch
+
+from fastmcp import FastMCP
+
+from connector_builder_mcp.build_strategies.declarative_openapi_v3 import manifest_checks
+from connector_builder_mcp.mcp._mcp_utils import ToolDomain, register_mcp_tools
+
+
+def test_repeated_registration_is_a_no_op():
+    """Test that registering the same domain twice on one app registers each tool once."""
+    app = FastMCP("test")
+
+    with patch.object(app, "tool", wraps=app.tool) as tool:
+        register_mcp_tools(app, domain=ToolDomain.VALIDATION)
+        first_count = tool.call_count
+        register_mcp_tools(app, domain=ToolDomain.VALIDATION)
+
+    assert first_count > 0
+    assert tool.call_count == first_count
+    assert manifest_checks.validate_openapi_spec.__name__ in asyncio.run(app.get_tools())
+
+
+def test_registration_is_tracked_per_app():
+    """Test that a new app still gets every tool registered."""
+    first_app = FastMCP("first")
+    second_app = FastMCP("second")
+
+    register_mcp_tools(first_app, domain=ToolDomain.VALIDATION)
+    register_mcp_tools(second_app, domain=ToolDomain.VALIDATION)
+
+    assert asyncio.run(first_app.get_tools()).keys() == asyncio.run(second_app.get_tools()).keys()
+
+
+def test_registration_filtered_by_package():
+    """Test that a package filter skips tools from other packages in the same domain."""
+    app = FastMCP("test")
+
+    register_mcp_tools(app, domain=ToolDomain.VALIDATION, package="connector_builder_mcp.mcp")
+
+    assert manifest_checks.validate_openapi_spec.__name__ not in asyncio.run(app.get_tools())
@@ -0,0 +1,202 @@
+"""Tests for the declarative OpenAPI v3 build strategy tools."""
+
+from pathlib import Path
+from typing import get_args
+from unittest.mock import patch
+
+import pytest
+from pydantic import ValidationError
+
+from connector_builder_mcp.build_strategies.declarative_openapi_v3 import (
+    manifest_checks,
+    manifest_tests,
+)
+from connector_builder_mcp.build_strategies.declarative_openapi_v3.guidance import (
+    _TOPIC_DOCS,
+    OpenApiDocsTopic,
+    get_openapi_connector_docs,
+)
+from connector_builder_mcp.build_strategies.declarative_openapi_v3.manifest_checks import (
+    OpenApiValidationResult,
+    validate_openapi_spec,
+)
+
+
+VALID_SPEC = """openapi: 3.0.0
+info:
+  title: Example API
+  version: 1.0.0
+paths:
+  /users:
+    get:
+      x-airbyte-resource: users
+      x-airbyte-verb: read
+"""
+
+
+class TestGetOpenApiConnectorDocs:
+    """Test OpenAPI connector documentation lookup."""
+
+    def test_overview(self):
+        """Test that the overview is returned when no topic is given."""
+        assert get_openapi_connector_docs().startswith("# OpenAPI/Sonar Connector Builder")
+
+    def test_empty_topic_returns_overview(self):
+        """Test that an empty topic from a direct caller returns the overview."""
+        assert get_openapi_connector_docs("") == get_openapi_connector_docs()  # type: ignore[arg-type]
+
+    def test_unknown_topic(self):
+        """Test that an unknown topic from a direct caller lists the available topics."""
+        doc = get_openapi_connector_docs("nope")  # type: ignore[arg-type]
+
+        assert "Topic 'nope' not found" in doc
+        assert "pagination" in doc
+
+    def test_every_topic_has_docs(self):
+        """Test that the topic literal and the docs mapping stay in sync."""
+        assert set(get_args(OpenApiDocsTopic)) == set(_TOPIC_DOCS)
+        for topic in get_args(OpenApiDocsTopic):
+            assert get_openapi_connector_docs(topic) == _TOPIC_DOCS[topic]
+
+
+class TestValidateOpenApiSpec:
+    """Test OpenAPI specification validation."""
+
+    def test_valid_spec(self, ctx):
+        """Test that a well-formed spec validates without warnings."""
+        result = validate_openapi_spec(ctx, spec_content=VALID_SPEC)
+
+        assert result.is_valid is True
+        assert result.errors == ()
+        assert result.warnings == ()
+
+    def test_missing_spec(self, ctx):
+        """Test that a missing spec is reported as an error."""
+        result = validate_openapi_spec(ctx, spec_content=None)
+
+        assert result.is_valid is False
+        assert result.errors == ("No OpenAPI specification provided",)
+
+    def test_openapi_and_paths_are_case_insensitive(self, ctx):
+        """Test that the 'openapi' and 'paths' markers match regardless of case."""
+        spec = VALID_SPEC.replace("openapi", "OpenAPI").replace("paths", "Paths")
+
+        result = validate_openapi_spec(ctx, spec_content=spec)
+
+        assert result.is_valid is True
+        assert result.warnings == ()
+
+    def test_missing_markers(self, ctx):
+        """Test errors and warnings when markers are missing."""
+        result = validate_openapi_spec(ctx, spec_content="swagger: '2.0'\nX-AIRBYTE: no\n")
+
+        assert result.is_valid is False
+        assert result.errors == ("Missing 'openapi' version field",)
+        assert len(result.warnings) == 2
+
+    def test_spec_file_path(self, ctx, tmp_path):
+        """Test that a path to a spec file is validated against the file contents."""
+        spec_path = tmp_path / "openapi.yaml"
+        spec_path.write_text(VALID_SPEC)
+
+        result = validate_openapi_spec(ctx, spec_content=str(spec_path))
+
+        assert result.is_valid is True
+        assert result.warnings == ()
+
+    def test_unreadable_spec_file(self, ctx, tmp_path):
+        """Test that a spec file that cannot be opened gives a validation error."""
+        spec_path = tmp_path / "openapi.yaml"
+        spec_path.write_text(VALID_SPEC)
+
+        with patch.object(Path, "open", side_effect=PermissionError("denied")):
+            result = validate_openapi_spec(ctx, spec_content=str(spec_path))
+
+        assert result.is_valid is False
+        assert result.errors == ("Could not read OpenAPI specification file: denied",)
+
+    def test_spec_file_length_counts_characters(self, ctx, tmp_path):
+        """Test that a spec file's length is measured in characters, like raw content."""
+        spec_path = tmp_path / "openapi.yaml"
+        spec_path.write_text("é" * 6, encoding="utf-8")
+
+        result = validate_openapi_spec(ctx, spec_content=str(spec_path))
+
+        assert "OpenAPI specification appears to be empty or too short" in result.errors
+
+    def test_spec_file_marker_across_chunks(self, ctx, tmp_path, monkeypatch):
+        """Test that markers spanning a chunk boundary are still found."""
+        monkeypatch.setattr(manifest_checks, "_SPEC_READ_CHUNK_SIZE", 4)
+        spec_path = tmp_path / "openapi.yaml"
+        spec_path.write_text(VALID_SPEC)
+
+        result = validate_openapi_spec(ctx, spec_content=str(spec_path))
+
+        assert result.is_valid is True
+        assert result.warnings == ()
+
+
+class TestResultModels:
+    """Test that result models built without validation still behave normally."""
+
+    def test_validation_result_serializes(self, ctx):
+        """Test that constructed validation results dump all fields, including defaults."""
+        result = validate_openapi_spec(ctx, spec_content=None)
+
+        assert result.model_dump() == {
+            "is_valid": False,
+            "errors": ("No OpenAPI specification provided",),
+            "warnings": (),
+            "resources_found": (),
+        }
+
+    def test_resource_test_result_serializes(self, ctx):
+        """Test that constructed resource test results dump all fields, including defaults."""
+        result = manifest_tests.test_openapi_resource(
+            ctx, resource_name="users", spec_content=VALID_SPEC
+        )
+
+        assert result.model_dump() == {
+            "success": False,
+            "message": "No configuration provided",
+            "records_read": 0,
+            "errors": ("Configuration with credentials is required for testing",),
+            "records": None,
+        }
+
+    def test_result_is_frozen(self, ctx):
+        """Test that result models reject mutation."""
+        result = validate_openapi_spec(ctx, spec_content=VALID_SPEC)
+
+        with pytest.raises(ValidationError):
+            result.is_valid = False  # type: ignore[misc]
+
+    def test_result_rejects_extra_fields(self):
+        """Test that validated construction still rejects unknown fields."""
+        with pytest.raises(ValidationError):
+            OpenApiValidationResult(is_valid=True, unexpected=1)  # type: ignore[call-arg]
+
+    def test_resource_test_success_result(self, ctx):
+        """Test that the success result carries the resource name and empty records."""
+        result = manifest_tests.test_openapi_resource(
+            ctx, resource_name="users", spec_content=VALID_SPEC, config={}
+        )
+
+        assert result.success is True
+        assert "'users'" in result.message
+        assert result.records == []
+        assert result.errors == ()
+
+    def test_resource_test_records_are_not_shared(self, ctx):
+        """Test that each success result gets its own records list."""
+        first = manifest_tests.test_openapi_resource(
+            ctx, resource_name="users", spec_content=VALID_SPEC, config={}
+        )
+        assert first.records is not None
+        first.records.append({"id": 1})
+
+        second = manifest_tests.test_openapi_resource(
+            ctx, resource_name="users", spec_content=VALID_SPEC, config={}
+        )
+
+        assert second.records == []
@@ -1,7 +1,21 @@
 """Tests for MCP server functionality."""
 
+import os
+import subprocess
+import sys
+
+from connector_builder_mcp.server import app
+
+
+_LIST_TOOLS_SCRIPT = """
+import asyncio
+
 from connector_builder_mcp.server import app
 
+print(" ".join(sorted(asyncio.run(app.get_tools()))))
+print(" ".join(sorted(asyncio.run(app.get_prompts()))))
+"""
+
 
 class TestMCPServer:
     """Test MCP server functionality."""
@@ -19,3 +33,19 @@ class TestMCPServer:
         """Test that the server can start up without errors."""
         assert app is not None
         assert app.name == "connector-builder-mcp"
+
+    def test_default_strategy_registered_in_fresh_interpreter(self):
+        """Test that the YAML strategy's tools are registered before airbyte-cdk is imported."""
+        result = subprocess.run(
+            [sys.executable, "-c", _LIST_TOOLS_SCRIPT],
+            capture_output=True,
+            text=True,
+            check=True,
+            env={k: v for k, v in os.environ.items() if k != "CONNECTOR_BUILDER_STRATEGY"},
+        )
+        tool_names, prompt_names = result.stdout.splitlines()[-2:]
+
+        assert "validate_manifest" in tool_names.split()
+        assert "execute_stream_test_read" in tool_names.split()
+        assert "get_connector_manifest" in tool_names.split()
+        assert "new_connector" in prompt_names.split()